@@ -14,6 +14,9 @@ MCP_SERVER_ARGS: List[str] = ["-m", "src.mcp_server.server"]
 MCP_TOOLS_TIMEOUT_SECONDS: int = 10
 MCP_CALL_TIMEOUT_SECONDS: int = 30
 
+# === Cache Configuration ===
+MCP_TOOLS_CACHE_TTL_SECONDS: int = 60
+
 # === UI Configuration ===
 DEBOUNCE_DELAY_MS: int = 300
 MAX_TEXT_LENGTH: int = 1000
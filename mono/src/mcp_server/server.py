@@ -12,10 +12,25 @@ import os
 import platform
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 from mcp.server.fastmcp import FastMCP
 
+# Names available to expressions evaluated by the calculate tool, read-only so
+# an expression cannot rebind them for later calls
+_CALCULATOR_NAMES: Mapping[str, Any] = MappingProxyType(
+    {
+        **{k: v for k, v in math.__dict__.items() if not k.startswith("__")},
+        "abs": abs,
+        "round": round,
+        "min": min,
+        "max": max,
+        "sum": sum,
+        "pow": pow,
+    }
+)
+
 
 class SimpleMCPServer:
     """A simple MCP server with basic tool implementations."""
@@ -35,21 +50,7 @@ class SimpleMCPServer:
             """Calculate mathematical expressions safely."""
             try:
                 # Only allow safe mathematical operations
-                allowed_names = {
-                    k: v for k, v in math.__dict__.items() if not k.startswith("__")
-                }
-                allowed_names.update(
-                    {
-                        "abs": abs,
-                        "round": round,
-                        "min": min,
-                        "max": max,
-                        "sum": sum,
-                        "pow": pow,
-                    }
-                )
-
-                result = eval(expression, {"__builtins__": {}}, allowed_names)
+                result = eval(expression, {"__builtins__": {}}, _CALCULATOR_NAMES)
                 return {"expression": expression, "result": result, "success": True}
             except Exception as e:
                 return {"expression": expression, "error": str(e), "success": False}
@@ -81,12 +81,19 @@ class ProcessTextResponse(BaseModel):
 
     @classmethod
     def from_chain(cls, chain: DecisionChain) -> "ProcessTextResponse":
-        """Create a response from a decision chain."""
-        return cls(
-            success=True,
-            result=LangChainDecisionResult.from_domain(chain),
-            error=None,
+        """
+        Create a response from a decision chain.
+
+        The chain is built by the service rather than parsed from user input, so
+        validation is skipped with ``model_construct``.
+        """
+        result = LangChainDecisionResult.model_construct(
+            chain_id=chain.chain_id,
+            title=chain.title,
+            final_decision=chain.final_decision or "No final decision reached",
+            step_count=len(chain.steps),
         )
+        return cls.model_construct(success=True, result=result, error=None)
 
     @classmethod
     def from_error(cls, error: str) -> "ProcessTextResponse":
@@ -2,42 +2,140 @@
 LangChain Agent Domain Models
 
 This module defines the domain models for the LangChain Agent.
+
+These models are only ever built by the service and the repository, never from
+untrusted input, so they are plain slotted classes. Pydantic validation is
+kept at the API boundary (see ``models/api.py``).
 """
 
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import orjson
 
 
-class DecisionStep(BaseModel):
-    """Model representing a single step in the decision process."""
+def _new_id() -> str:
+    """Generate a new unique identifier."""
+    return str(uuid4())
 
-    step_id: str = Field(default_factory=lambda: str(uuid4()))
-    step_number: int = Field(description="The sequence number of this step")
-    reasoning: str = Field(description="The reasoning behind this step")
-    decision: str = Field(description="The decision made in this step")
-    next_actions: List[str] = Field(
-        default_factory=list, description="Next actions to take based on this decision"
-    )
-    metadata: Dict[str, Any] = Field(
-        default_factory=dict, description="Additional metadata for this step"
+
+class DecisionStep:
+    """
+    Model representing a single step in the decision process.
+
+    ``next_actions`` and ``metadata`` are persisted as JSON. Steps loaded from
+    storage keep the raw JSON and only decode it on first access, so callers that
+    only need counts or titles never pay for ``orjson.loads``.
+    """
+
+    __slots__ = (
+        "step_id",
+        "step_number",
+        "reasoning",
+        "decision",
+        "_next_actions",
+        "_metadata",
+        "_raw_next_actions",
+        "_raw_metadata",
     )
 
+    def __init__(
+        self,
+        *,
+        step_number: int,
+        reasoning: str,
+        decision: str,
+        step_id: Optional[str] = None,
+        next_actions: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.step_id = step_id or _new_id()
+        self.step_number = step_number
+        self.reasoning = reasoning
+        self.decision = decision
+        self._next_actions = next_actions if next_actions is not None else []
+        self._metadata = metadata if metadata is not None else {}
+        self._raw_next_actions: Optional[str] = None
+        self._raw_metadata: Optional[str] = None
+
+    @classmethod
+    def from_json_columns(
+        cls,
+        *,
+        step_id: str,
+        step_number: int,
+        reasoning: str,
+        decision: str,
+        next_actions_json: str,
+        metadata_json: str,
+    ) -> "DecisionStep":
+        """Create a step from persisted JSON columns without decoding them."""
+        step = cls(
+            step_id=step_id,
+            step_number=step_number,
+            reasoning=reasoning,
+            decision=decision,
+        )
+        step._next_actions = None
+        step._metadata = None
+        step._raw_next_actions = next_actions_json
+        step._raw_metadata = metadata_json
+        return step
+
+    @property
+    def next_actions(self) -> List[str]:
+        """Next actions to take based on this decision."""
+        if self._next_actions is None:
+            self._next_actions = orjson.loads(self._raw_next_actions or "[]")
+            self._raw_next_actions = None
+        return self._next_actions
+
+    @next_actions.setter
+    def next_actions(self, value: List[str]) -> None:
+        self._next_actions = value
+        self._raw_next_actions = None
 
-class DecisionChain(BaseModel):
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Additional metadata for this step."""
+        if self._metadata is None:
+            self._metadata = orjson.loads(self._raw_metadata or "{}")
+            self._raw_metadata = None
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+        self._raw_metadata = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DecisionStep):
+            return NotImplemented
+        return (
+            self.step_id == other.step_id
+            and self.step_number == other.step_number
+            and self.reasoning == other.reasoning
+            and self.decision == other.decision
+            and self.next_actions == other.next_actions
+            and self.metadata == other.metadata
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DecisionStep(step_id={self.step_id!r}, step_number={self.step_number!r}, "
+            f"reasoning={self.reasoning!r}, decision={self.decision!r}, "
+            f"next_actions={self.next_actions!r}, metadata={self.metadata!r})"
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class DecisionChain:
     """Model representing a chain of decision steps."""
 
-    chain_id: str = Field(default_factory=lambda: str(uuid4()))
-    title: str = Field(description="Title for this decision chain")
-    context: str = Field(description="The context that prompted this decision chain")
-    steps: List[DecisionStep] = Field(
-        default_factory=list, description="The steps in this decision chain"
-    )
-    final_decision: Optional[str] = Field(
-        None, description="The final decision reached at the end of the chain"
-    )
-    status: str = Field(
-        default="in_progress",
-        description="Status of the decision chain (in_progress, completed, error)",
-    )
+    chain_id: str = field(default_factory=_new_id)
+    title: str  # Title for this decision chain
+    context: str  # The context that prompted this decision chain
+    steps: List[DecisionStep] = field(default_factory=list)
+    final_decision: Optional[str] = None
+    status: str = "in_progress"  # in_progress, completed, error
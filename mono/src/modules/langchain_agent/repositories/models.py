@@ -4,9 +4,9 @@ Database Models for LangChain Agent
 This module defines SQLAlchemy models for persisting decision chains and steps.
 """
 import datetime
-import json
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
+import orjson
 from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
 from sqlalchemy.orm import Session, declarative_base, relationship
 
@@ -16,6 +16,19 @@ Base = declarative_base()
 T = TypeVar("T")
 
 
+def to_json_column(value: Any) -> str:
+    """
+    Serialize a value for storage in a JSON text column.
+
+    Args:
+        value: The list or dict to serialize
+
+    Returns:
+        The compact JSON text
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 class ChainModel(Base):
     """SQLAlchemy model for persisting decision chains."""
 
@@ -41,10 +54,10 @@ class ChainModel(Base):
 
     def to_pydantic(self) -> DecisionChain:
         """
-        Convert the SQLAlchemy model to a Pydantic model.
+        Convert the SQLAlchemy model to a domain model.
 
         Returns:
-            DecisionChain: A Pydantic model instance
+            DecisionChain: A domain model instance
         """
         return DecisionChain(
             chain_id=self.chain_id,
@@ -58,10 +71,10 @@ class ChainModel(Base):
     @classmethod
     def from_pydantic(cls, chain: DecisionChain) -> "ChainModel":
         """
-        Create a SQLAlchemy model from a Pydantic model.
+        Create a SQLAlchemy model from a domain model.
 
         Args:
-            chain: The Pydantic model to convert
+            chain: The domain model to convert
 
         Returns:
             ChainModel: A SQLAlchemy model instance
@@ -98,27 +111,27 @@ class StepModel(Base):
 
     def to_pydantic(self) -> DecisionStep:
         """
-        Convert the SQLAlchemy model to a Pydantic model.
+        Convert the SQLAlchemy model to a domain model.
 
         Returns:
-            DecisionStep: A Pydantic model instance
+            DecisionStep: A domain model instance
         """
-        return DecisionStep(
+        return DecisionStep.from_json_columns(
             step_id=self.step_id,
             step_number=self.step_number,
             reasoning=self.reasoning,
             decision=self.decision,
-            next_actions=json.loads(self.next_actions),
-            metadata=json.loads(self.meta_data),  # Convert meta_data back to metadata
+            next_actions_json=self.next_actions,
+            metadata_json=self.meta_data,  # Convert meta_data back to metadata
         )
 
     @classmethod
     def from_pydantic(cls, step: DecisionStep, chain_id: str) -> "StepModel":
         """
-        Create a SQLAlchemy model from a Pydantic model.
+        Create a SQLAlchemy model from a domain model.
 
         Args:
-            step: The Pydantic model to convert
+            step: The domain model to convert
             chain_id: The ID of the parent chain
 
         Returns:
@@ -130,8 +143,8 @@ class StepModel(Base):
             step_number=step.step_number,
             reasoning=step.reasoning,
             decision=step.decision,
-            next_actions=json.dumps(step.next_actions),
-            meta_data=json.dumps(step.metadata),  # Store metadata as meta_data
+            next_actions=to_json_column(step.next_actions),
+            meta_data=to_json_column(step.metadata),  # Store metadata as meta_data
         )
 
 
@@ -4,17 +4,22 @@ SQLite Repository Implementation
 This module provides a SQLite-based implementation of the repository interfaces.
 """
 
-import json
 import os
+from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, List, Optional, cast
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, cast
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from src.modules.langchain_agent.models.domain import DecisionChain, DecisionStep
-from src.modules.langchain_agent.repositories.models import Base, ChainModel, StepModel
+from src.modules.langchain_agent.repositories.models import (
+    Base,
+    ChainModel,
+    StepModel,
+    to_json_column,
+)
 
 # Default SQLite database location
 DEFAULT_DB_PATH = os.path.join(
@@ -48,18 +53,16 @@ def get_engine(db_path: Optional[str] = None) -> Engine:
 
 
 @contextmanager
-def get_session(db_path: Optional[str] = None) -> Iterator[Session]:
+def session_scope(session_factory: sessionmaker) -> Iterator[Session]:
     """
-    Get a database session as a context manager.
+    Run a unit of work in a session that commits on success.
 
     Args:
-        db_path: Path to the SQLite database file
+        session_factory: Factory creating the session
 
     Yields:
-        SQLAlchemy session
+        SQLAlchemy session, rolled back if the block raises
     """
-    engine = get_engine(db_path)
-    session_factory = sessionmaker(bind=engine)
     session = session_factory()
 
     try:
@@ -72,17 +75,46 @@ def get_session(db_path: Optional[str] = None) -> Iterator[Session]:
         session.close()
 
 
+@contextmanager
+def get_session(db_path: Optional[str] = None) -> Iterator[Session]:
+    """
+    Get a database session as a context manager.
+
+    Args:
+        db_path: Path to the SQLite database file
+
+    Yields:
+        SQLAlchemy session
+    """
+    engine = get_engine(db_path)
+    with session_scope(sessionmaker(bind=engine)) as session:
+        yield session
+
+
 class SQLiteDecisionChainRepository:
     """SQLite implementation of the decision chain repository."""
 
-    def __init__(self, db_path: Optional[str] = None):
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        session_factory: Optional[sessionmaker] = None,
+    ):
         """
         Initialize the repository.
 
         Args:
             db_path: Path to the SQLite database file
+            session_factory: Factory for sessions on an existing engine or
+                connection; if given, it is used instead of db_path
         """
         self.db_path = db_path
+        self.session_factory = session_factory
+
+    def _session(self) -> ContextManager[Session]:
+        """Open a session on the repository's database that commits on success."""
+        if self.session_factory is not None:
+            return session_scope(self.session_factory)
+        return get_session(self.db_path)
 
     def save_chain(self, chain: DecisionChain) -> str:
         """
@@ -94,7 +126,7 @@ class SQLiteDecisionChainRepository:
         Returns:
             The ID of the saved chain
         """
-        with get_session(self.db_path) as session:
+        with self._session() as session:
             # Check if the chain already exists
             db_chain = (
                 session.query(ChainModel).filter_by(chain_id=chain.chain_id).first()
@@ -119,43 +151,53 @@ class SQLiteDecisionChainRepository:
                 session.flush()
 
             # Save steps
-            for step in chain.steps:
-                self._save_step(session, step, chain.chain_id)
+            self._save_steps(session, chain.steps, chain.chain_id)
 
             return db_chain.chain_id
 
-    def _save_step(self, session: Session, step: DecisionStep, chain_id: str) -> None:
+    def _save_steps(
+        self, session: Session, steps: List[DecisionStep], chain_id: str
+    ) -> None:
         """
-        Save a decision step.
+        Save the decision steps of a chain.
+
+        Existing steps are looked up with one query and new steps are inserted
+        with a single flush.
 
         Args:
             session: SQLAlchemy session
-            step: The decision step to save
+            steps: The decision steps to save
             chain_id: The ID of the parent chain
         """
-        # Check if the step already exists
-        db_step = session.query(StepModel).filter_by(step_id=step.step_id).first()
-
-        if db_step:
-            # Update existing step
-            db_step.step_number = step.step_number
-            db_step.reasoning = step.reasoning
-            db_step.decision = step.decision
-            db_step.next_actions = json.dumps(step.next_actions)
-            db_step.meta_data = json.dumps(step.metadata)
-        else:
-            # Create new step
-            db_step = StepModel(
-                step_id=step.step_id,
-                chain_id=chain_id,
-                step_number=step.step_number,
-                reasoning=step.reasoning,
-                decision=step.decision,
-                next_actions=json.dumps(step.next_actions),
-                meta_data=json.dumps(step.metadata),
+        if not steps:
+            return
+
+        step_ids = [step.step_id for step in steps]
+        db_steps = {
+            db_step.step_id: db_step
+            for db_step in session.query(StepModel).filter(
+                StepModel.step_id.in_(step_ids)
             )
-            session.add(db_step)
-            session.flush()
+        }
+
+        new_steps = []
+        for step in steps:
+            db_step = db_steps.get(step.step_id)
+            if db_step:
+                # Update existing step
+                db_step.step_number = step.step_number
+                db_step.reasoning = step.reasoning
+                db_step.decision = step.decision
+                db_step.next_actions = to_json_column(step.next_actions)
+                db_step.meta_data = to_json_column(step.metadata)
+            else:
+                # Create new step
+                db_step = StepModel.from_pydantic(step, chain_id)
+                db_steps[step.step_id] = db_step
+                new_steps.append(db_step)
+
+        session.add_all(new_steps)
+        session.flush()
 
     def get_chain(self, chain_id: str) -> Optional[DecisionChain]:
         """
@@ -167,7 +209,7 @@ class SQLiteDecisionChainRepository:
         Returns:
             The decision chain or None if not found
         """
-        with get_session(self.db_path) as session:
+        with self._session() as session:
             db_chain = session.query(ChainModel).filter_by(chain_id=chain_id).first()
 
             if not db_chain:
@@ -182,17 +224,7 @@ class SQLiteDecisionChainRepository:
             )
 
             # Convert to domain model
-            steps = [
-                DecisionStep(
-                    step_id=step.step_id,
-                    step_number=step.step_number,
-                    reasoning=step.reasoning,
-                    decision=step.decision,
-                    next_actions=json.loads(step.next_actions),
-                    metadata=json.loads(step.meta_data),
-                )
-                for step in db_steps
-            ]
+            steps = [step.to_pydantic() for step in db_steps]
 
             return DecisionChain(
                 chain_id=db_chain.chain_id,
@@ -213,7 +245,7 @@ class SQLiteDecisionChainRepository:
         Returns:
             List of decision chains
         """
-        with get_session(self.db_path) as session:
+        with self._session() as session:
             db_chains = (
                 session.query(ChainModel)
                 .order_by(ChainModel.created_at.desc())
@@ -221,42 +253,34 @@ class SQLiteDecisionChainRepository:
                 .all()
             )
 
-            # Convert to domain models
-            chains = []
-            for db_chain in db_chains:
-                # Get steps
+            # Load the steps of all chains in one query
+            steps_by_chain: Dict[str, List[DecisionStep]] = defaultdict(list)
+            if db_chains:
                 db_steps = (
                     session.query(StepModel)
-                    .filter_by(chain_id=db_chain.chain_id)
-                    .order_by(StepModel.step_number)
+                    .filter(
+                        StepModel.chain_id.in_(
+                            [db_chain.chain_id for db_chain in db_chains]
+                        )
+                    )
+                    .order_by(StepModel.chain_id, StepModel.step_number)
                     .all()
                 )
+                for db_step in db_steps:
+                    steps_by_chain[db_step.chain_id].append(db_step.to_pydantic())
 
-                # Convert to domain model
-                steps = [
-                    DecisionStep(
-                        step_id=step.step_id,
-                        step_number=step.step_number,
-                        reasoning=step.reasoning,
-                        decision=step.decision,
-                        next_actions=json.loads(step.next_actions),
-                        metadata=json.loads(step.meta_data),
-                    )
-                    for step in db_steps
-                ]
-
-                chains.append(
-                    DecisionChain(
-                        chain_id=db_chain.chain_id,
-                        title=db_chain.title,
-                        context=db_chain.context,
-                        final_decision=db_chain.final_decision,
-                        status=db_chain.status,
-                        steps=steps,
-                    )
+            # Convert to domain models
+            return [
+                DecisionChain(
+                    chain_id=db_chain.chain_id,
+                    title=db_chain.title,
+                    context=db_chain.context,
+                    final_decision=db_chain.final_decision,
+                    status=db_chain.status,
+                    steps=steps_by_chain[db_chain.chain_id],
                 )
-
-            return chains
+                for db_chain in db_chains
+            ]
 
     def delete_chain(self, chain_id: str) -> bool:
         """
@@ -268,7 +292,7 @@ class SQLiteDecisionChainRepository:
         Returns:
             True if the chain was deleted, False otherwise
         """
-        with get_session(self.db_path) as session:
+        with self._session() as session:
             # Delete steps first
             session.query(StepModel).filter_by(chain_id=chain_id).delete()
 
@@ -17,6 +17,7 @@ def get_langchain_agent_service(
     llm: Optional[BaseLanguageModel] = None,
     verbose: bool = False,
     max_iterations: int = 5,
+    llm_titles: bool = False,
 ) -> LangChainAgentService:
     """
     Get the LangChain agent service instance.
@@ -26,6 +27,7 @@ def get_langchain_agent_service(
         llm: The language model to use
         verbose: Whether to print verbose output during execution
         max_iterations: Maximum number of iterations for the agent to run
+        llm_titles: Whether to ask the LLM for chain titles
 
     Returns:
         LangChain agent service instance
@@ -36,4 +38,5 @@ def get_langchain_agent_service(
         llm=llm,
         verbose=verbose,
         max_iterations=max_iterations,
+        llm_titles=llm_titles,
     )
@@ -4,23 +4,54 @@ LangChain Agent Service
 This module contains the business logic for the LangChain Agent.
 """
 
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
-from langchain.agents import AgentExecutor, create_react_agent
-from langchain.chains import LLMChain
-from langchain.prompts import PromptTemplate
 from langchain_community.chat_message_histories import ChatMessageHistory
-from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.runnables.history import RunnableWithMessageHistory
+from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 
 from src.modules.langchain_agent.models.domain import DecisionChain, DecisionStep
 from src.modules.langchain_agent.repositories.interfaces import DecisionChainRepository
 from src.modules.llms import AIClientError
-from src.modules.llms.ai_client import default_client
+from src.modules.llms.ai_client import get_default_client
 from src.utils.settings import settings
 
+# Runs title generation in the background while the first step is analysed
+_title_executor = ThreadPoolExecutor(thread_name_prefix="decision-title")
+
+# Parsed once and shared by all service instances. The static instructions come
+# first so that providers can serve the shared prefix from their prompt cache.
+_DECISION_PROMPT = PromptTemplate.from_template(
+    """You are a decision-making assistant that helps with complex problems.
+
+Think through this step-by-step:
+1. Analyze the context carefully
+2. Identify key decision points
+3. Evaluate options for each decision
+4. Make recommendations based on your analysis
+
+Provide a detailed and thoughtful response that shows your reasoning process.
+
+Context: {context}
+
+{chat_history}
+
+Human: {input}
+"""
+)
+
+
+def _local_title(context: str) -> str:
+    """Build a title from the first few words of the context's first sentence."""
+    first_sentence = re.split(r"[.!?\n]", context, maxsplit=1)[0]
+    # Only upper-case the first letter, so "what's" and "AI-driven" stay intact
+    words = [word[:1].upper() + word[1:] for word in first_sentence.split()[:7]]
+    return " ".join(words) or "Decision Process"
+
 
 class LangChainAgentService:
     """Service for multi-step decision making using LangChain."""
@@ -31,6 +62,8 @@ class LangChainAgentService:
         llm: Optional[BaseLanguageModel] = None,
         verbose: bool = False,
         max_iterations: int = 5,
+        history_window: int = 6,
+        llm_titles: bool = False,
     ):
         """
         Initialize the LangChain decision-making agent service.
@@ -40,6 +73,9 @@ class LangChainAgentService:
             llm: The language model to use (defaults to OpenAI model from settings)
             verbose: Whether to print verbose output during execution
             max_iterations: Maximum number of iterations for the agent to run
+            history_window: Number of most recent chat messages sent with each step
+            llm_titles: Whether to ask the LLM for chain titles instead of deriving
+                them from the context
         """
         # Store repository
         self.repository = repository
@@ -49,9 +85,12 @@ class LangChainAgentService:
             api_key=settings.OPENAI_API_KEY,
             model_name=settings.MODEL_NAME,
             temperature=settings.TEMPERATURE,
+            service_tier=settings.OPENAI_SERVICE_TIER or None,
         )
         self.verbose = verbose
         self.max_iterations = max_iterations
+        self.history_window = history_window
+        self.llm_titles = llm_titles
 
         # Create a message history for the agent
         self.message_history = ChatMessageHistory()
@@ -69,49 +108,25 @@ class LangChainAgentService:
         Returns:
             A simple object with an invoke method that calls the LLM
         """
-        # Create a simple prompt template for decision making
-        prompt = PromptTemplate.from_template(
-            """You are a decision-making assistant that helps with complex problems.
-            
-            Context: {context}
-            
-            Think through this step-by-step:
-            1. Analyze the context carefully
-            2. Identify key decision points
-            3. Evaluate options for each decision
-            4. Make recommendations based on your analysis
-            
-            Provide a detailed and thoughtful response that shows your reasoning process.
-            
-            {chat_history}
-            
-            Human: {input}
-            """
-        )
-
         # Create a runnable sequence (prompt | llm) instead of using LLMChain
-        runnable = prompt | self.llm
+        runnable = _DECISION_PROMPT | self.llm
 
         # Create a wrapper that mimics the AgentExecutor interface but just uses the LLM
         class SimpleLLMExecutor:
             def __init__(self, runnable):
                 self.runnable = runnable
 
-            def invoke(self, input_data):
+            @staticmethod
+            def _runnable_input(input_data):
                 # Extract the input and context from the input data
-                input_text = input_data.get("input", "")
-                context = input_data.get("context", "")
-                chat_history = input_data.get("chat_history", [])
-
-                # Call the runnable with the input data
-                response = self.runnable.invoke(
-                    {
-                        "input": input_text,
-                        "context": context,
-                        "chat_history": chat_history,
-                    }
-                )
+                return {
+                    "input": input_data.get("input", ""),
+                    "context": input_data.get("context", ""),
+                    "chat_history": input_data.get("chat_history", []),
+                }
 
+            @staticmethod
+            def _output(response):
                 # Handle case where response is an AIMessage or other message type
                 if hasattr(response, "content"):
                     response = response.content
@@ -119,8 +134,21 @@ class LangChainAgentService:
                 # Return a dictionary with the output to match AgentExecutor interface
                 return {"output": response}
 
+            def invoke(self, input_data):
+                response = self.runnable.invoke(self._runnable_input(input_data))
+                return self._output(response)
+
+            async def ainvoke(self, input_data):
+                response = await self.runnable.ainvoke(self._runnable_input(input_data))
+                return self._output(response)
+
         return SimpleLLMExecutor(runnable)
 
+    @staticmethod
+    def _title_prompt(context: str) -> str:
+        """Build the prompt used to generate a chain title."""
+        return f"Generate a concise title (5-7 words) for a decision process about: {context}"
+
     def create_decision_chain(
         self, context: str, title: Optional[str] = None
     ) -> DecisionChain:
@@ -136,12 +164,7 @@ class LangChainAgentService:
         """
         # Generate a title if not provided
         if not title:
-            prompt = f"Generate a concise title (5-7 words) for a decision process about: {context}"
-            try:
-                title = default_client.generate_response(prompt).strip()
-            except AIClientError as e:
-                # Fallback to a generic title if AI generation fails
-                title = "Decision Process"
+            title = self._generate_title(context)
 
         # Create a new decision chain
         self.active_chain = DecisionChain(
@@ -152,6 +175,33 @@ class LangChainAgentService:
 
         return self.active_chain
 
+    def _generate_title(self, context: str) -> str:
+        """Generate a title for a decision chain about ``context``."""
+        if not self.llm_titles:
+            return _local_title(context)
+        try:
+            return (
+                get_default_client()
+                .generate_response(self._title_prompt(context))
+                .strip()
+            )
+        except AIClientError as e:
+            # Fallback to a generic title if AI generation fails
+            return "Decision Process"
+
+    async def _agenerate_title(self, context: str) -> str:
+        """Generate a chain title without blocking the event loop."""
+        if not self.llm_titles:
+            return _local_title(context)
+        try:
+            title = await get_default_client().agenerate_response(
+                self._title_prompt(context)
+            )
+            return title.strip()
+        except AIClientError as e:
+            # Fallback to a generic title if AI generation fails
+            return "Decision Process"
+
     def add_decision_step(
         self,
         reasoning: str,
@@ -213,81 +263,176 @@ class LangChainAgentService:
 
         return self.active_chain
 
+    @staticmethod
+    def _step_prompt(step_number: int) -> str:
+        """Build the prompt for a given analysis step."""
+        if step_number == 1:
+            return "Analyze the context and make an initial decision."
+        return f"Based on your previous decision, what is the next step (step {step_number})?"
+
+    def _step_input(
+        self, step_number: int, text: str, history: ChatMessageHistory
+    ) -> Dict[str, Any]:
+        """Build the agent input for a given analysis step."""
+        messages = history.messages
+        # Slice from an explicit start, since messages[-0:] is the whole list
+        window_start = max(len(messages) - self.history_window, 0)
+        return {
+            "input": self._step_prompt(step_number),
+            "context": text,
+            "chat_history": messages[window_start:],
+        }
+
+    def _record_step(
+        self,
+        chain: DecisionChain,
+        history: ChatMessageHistory,
+        step_number: int,
+        output: str,
+    ) -> None:
+        """Add an agent output to the chat history and the decision chain."""
+        # Add to chat history
+        history.add_user_message(self._step_prompt(step_number))
+        history.add_ai_message(output)
+
+        # Split the output into reasoning and decision
+        reasoning, separator, decision = output.partition("\n\n")
+        if not separator:
+            decision = reasoning
+
+        # Determine next actions
+        next_actions = []
+        if step_number < self.max_iterations:
+            next_actions = ["Continue to next step"]
+
+        # Add the step to the chain
+        chain.steps.append(
+            DecisionStep(
+                step_number=len(chain.steps) + 1,
+                reasoning=reasoning,
+                decision=decision,
+                next_actions=next_actions,
+            )
+        )
+
+    @staticmethod
+    def _finish_chain(chain: DecisionChain) -> DecisionChain:
+        """Complete the chain with a final decision based on its last step."""
+        chain.final_decision = (
+            f"After {len(chain.steps)} steps of analysis, "
+            f"the final decision is: {chain.steps[-1].decision}"
+        )
+        chain.status = "completed"
+        return chain
+
     def process_text(self, text: str) -> DecisionChain:
         """
         Process text to generate a decision chain.
 
+        When LLM titles are enabled, the title is generated in a background
+        thread while the first analysis step runs.
+
         Args:
             text: The input text to process
 
         Returns:
             The generated decision chain
         """
-        # Create a new decision chain
-        chain = self.create_decision_chain(context=text)
+        title_future = None
+        if self.llm_titles:
+            title_future = _title_executor.submit(self._generate_title, text)
 
         # Reset chat history
-        self.message_history.clear()
-
-        # Initialize step counter
-        step_number = 1
-
-        # Run the agent for multiple steps
-        for _ in range(self.max_iterations):
-            # Generate a prompt for this step
-            if step_number == 1:
-                prompt = "Analyze the context and make an initial decision."
-            else:
-                prompt = f"Based on your previous decision, what is the next step (step {step_number})?"
-
-            # Run the agent
-            result = self.agent.invoke(
-                {
-                    "input": prompt,
-                    "context": text,
-                    "chat_history": self.message_history.messages,
-                }
-            )
+        history = self.message_history
+        history.clear()
 
-            # Extract the output
-            output = result.get("output", "")
+        first_result = self.agent.invoke(self._step_input(1, text, history))
+        title = title_future.result() if title_future else _local_title(text)
+        chain = self.create_decision_chain(context=text, title=title)
+        self._record_step(chain, history, 1, first_result.get("output", ""))
 
-            # Add to chat history
-            self.message_history.add_user_message(prompt)
-            self.message_history.add_ai_message(output)
+        # Run the agent for the remaining steps
+        for step_number in range(2, self.max_iterations + 1):
+            result = self.agent.invoke(self._step_input(step_number, text, history))
+            self._record_step(chain, history, step_number, result.get("output", ""))
 
-            # Split the output into reasoning and decision
-            parts = output.split("\n\n", 1)
-            reasoning = parts[0]
-            decision = parts[1] if len(parts) > 1 else reasoning
+        return self._finish_chain(chain)
 
-            # Determine next actions
-            next_actions = []
-            if step_number < self.max_iterations:
-                next_actions = ["Continue to next step"]
+    async def aprocess_text(self, text: str) -> DecisionChain:
+        """
+        Async version of ``process_text``.
 
-            # Add the step to the chain
-            self.add_decision_step(
-                reasoning=reasoning,
-                decision=decision,
-                next_actions=next_actions,
+        The title generation and the first analysis step do not depend on each
+        other, so they are sent concurrently.
+
+        Args:
+            text: The input text to process
+
+        Returns:
+            The generated decision chain
+        """
+        # Reset chat history
+        history = self.message_history
+        history.clear()
+
+        title, first_result = await asyncio.gather(
+            self._agenerate_title(text),
+            self.agent.ainvoke(self._step_input(1, text, history)),
+        )
+        chain = self.create_decision_chain(context=text, title=title)
+        self._record_step(chain, history, 1, first_result.get("output", ""))
+
+        for step_number in range(2, self.max_iterations + 1):
+            result = await self.agent.ainvoke(
+                self._step_input(step_number, text, history)
             )
+            self._record_step(chain, history, step_number, result.get("output", ""))
 
-            # Increment step counter
-            step_number += 1
+        return self._finish_chain(chain)
 
-            # Stop if we've reached the maximum number of steps
-            if step_number > self.max_iterations:
-                break
+    async def process_texts(self, texts: List[str]) -> List[DecisionChain]:
+        """
+        Process several texts concurrently, one decision chain per text.
 
-        # Complete the chain with a final decision
-        final_decision = (
-            f"After {step_number - 1} steps of analysis, "
-            f"the final decision is: {chain.steps[-1].decision}"
+        Each text gets its own chat history. At every step the requests for all
+        texts are sent together, and the titles are generated alongside the
+        first step. The active chain is left untouched.
+
+        Args:
+            texts: The input texts to process
+
+        Returns:
+            The generated decision chains, in the same order as ``texts``
+        """
+        histories = [ChatMessageHistory() for _ in texts]
+
+        titles, first_results = await asyncio.gather(
+            asyncio.gather(*[self._agenerate_title(text) for text in texts]),
+            asyncio.gather(
+                *[
+                    self.agent.ainvoke(self._step_input(1, text, history))
+                    for text, history in zip(texts, histories)
+                ]
+            ),
         )
-        self.complete_decision_chain(final_decision)
+        chains = [
+            DecisionChain(title=title, context=text, steps=[])
+            for title, text in zip(titles, texts)
+        ]
+        for chain, history, result in zip(chains, histories, first_results):
+            self._record_step(chain, history, 1, result.get("output", ""))
+
+        for step_number in range(2, self.max_iterations + 1):
+            results = await asyncio.gather(
+                *[
+                    self.agent.ainvoke(self._step_input(step_number, text, history))
+                    for text, history in zip(texts, histories)
+                ]
+            )
+            for chain, history, result in zip(chains, histories, results):
+                self._record_step(chain, history, step_number, result.get("output", ""))
 
-        return chain
+        return [self._finish_chain(chain) for chain in chains]
 
     def process_text_with_persistence(self, text: str) -> Tuple[DecisionChain, str]:
         """
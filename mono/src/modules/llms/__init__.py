@@ -7,11 +7,11 @@ from src.modules.llms.ai_client import (
     GeminiError,
     InvalidAPIKeyError,
     OpenAIError,
-    default_client,
+    get_default_client,
 )
 
 __all__ = [
-    "default_client",
+    "get_default_client",
     "AIClientError",
     "OpenAIError",
     "GeminiError",
@@ -3,13 +3,43 @@ AI Client Module
 
 This module provides functionality to interact with external AI language models.
 """
+import asyncio
 import logging
-from typing import Dict, List, Optional, Union
+import weakref
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from google import genai
-from openai import OpenAI
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
-
+from google.genai import errors as genai_errors
+from openai import (
+    NOT_GIVEN,
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
+from tenacity import (
+    AsyncRetrying,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
+
+from src.modules.llms.cache import Embedding, LLMCache, SemanticCache
 from src.utils.settings import settings
 
 # Configure logger for this module
@@ -19,6 +49,77 @@ logger = logging.getLogger(__name__)
 # Define Message type for clarity
 Message = Dict[str, str]  # Contains 'role' and 'content' keys
 
+T = TypeVar("T")
+
+# Kept identical across requests so the prompt prefix stays cacheable
+DEFAULT_SYSTEM_PROMPT = "You are a helpful assistant."
+
+# Shared by every request; message dicts are never mutated once built
+DEFAULT_SYSTEM_MESSAGE: Message = {"role": "system", "content": DEFAULT_SYSTEM_PROMPT}
+_DEEPSEEK_SYSTEM_MESSAGE: Message = {
+    "role": "system",
+    "content": settings.DEEPSEEK_SYSTEM_PROMPT,
+}
+
+# Async calls are bounded per provider since their rate limits differ
+PROVIDER_CONCURRENCY: Dict[str, int] = {
+    "openai": settings.LLM_MAX_CONCURRENCY,
+    "gemini": settings.GEMINI_MAX_CONCURRENCY,
+    "deepseek": settings.DEEPSEEK_MAX_CONCURRENCY,
+}
+
+# Semaphores are bound to the event loop they are first awaited on, so one set
+# is kept per running loop
+_provider_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """Get the concurrency limiter for a provider on the running event loop."""
+    semaphores = _provider_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if provider not in semaphores:
+        semaphores[provider] = asyncio.Semaphore(PROVIDER_CONCURRENCY[provider])
+    return semaphores[provider]
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a provider error is worth retrying (rate limits, timeouts, 5xx)."""
+    if isinstance(
+        exc, (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+    ):
+        return True
+    return isinstance(exc, genai_errors.APIError) and (
+        exc.code == 429 or exc.code >= 500
+    )
+
+
+# Provider SDK retries are disabled so that this is the only retry layer
+_RETRY_POLICY: Dict[str, Any] = {
+    "stop": stop_after_attempt(4),
+    "wait": wait_exponential_jitter(initial=0.5, max=10),
+    "retry": retry_if_exception(_is_transient),
+    "reraise": True,
+}
+
+
+def _call_with_retries(call: Callable[[], T]) -> T:
+    """Run a provider call, retrying transient failures with jittered backoff."""
+    return Retrying(**_RETRY_POLICY)(call)
+
+
+async def _call_with_limits(provider: str, call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Run an async provider call under its concurrency limit.
+
+    Transient failures are retried with jittered exponential backoff; the
+    semaphore is released while waiting so other calls can proceed.
+    """
+
+    async def limited_call() -> T:
+        async with _provider_semaphore(provider):
+            return await call()
+
+    return await AsyncRetrying(**_RETRY_POLICY)(limited_call)
+
 
 # Custom exception classes
 class AIClientError(Exception):
@@ -51,6 +152,16 @@ class InvalidAPIKeyError(AIClientError):
     pass
 
 
+@dataclass
+class _CacheLookup:
+    """Result of checking the response caches before calling a provider."""
+
+    response: Optional[str] = None
+    key: Optional[str] = None
+    bucket: Optional[str] = None
+    embedding: Optional[Embedding] = None
+
+
 class AIClient:
     """Client for interacting with external AI models."""
 
@@ -74,15 +185,148 @@ class AIClient:
                     f"Using OpenAI project API key with organization ID: {openai_org}"
                 )
 
-        client_args = {"api_key": openai_key}
+        client_args = {"api_key": openai_key, "max_retries": 0}
         if openai_org:
             client_args["organization"] = openai_org
 
         self.client = OpenAI(**client_args)
+        self.aclient = AsyncOpenAI(**client_args)
+
+        # One Gemini client serves both sync and async (``.aio``) calls
+        self.gemini_client: Optional[genai.Client] = None
+        if settings.GEMINI_API_KEY:
+            self.gemini_client = genai.Client(api_key=settings.GEMINI_API_KEY)
+
+        # Deepseek clients are kept so their connection pools are reused
+        self.deepseek_client: Optional[OpenAI] = None
+        self.adeepseek_client: Optional[AsyncOpenAI] = None
+        if settings.DEEPSEEK_API_KEY:
+            deepseek_args = {
+                "api_key": settings.DEEPSEEK_API_KEY,
+                "base_url": "https://api.deepseek.com",
+                "max_retries": 0,
+            }
+            self.deepseek_client = OpenAI(**deepseek_args)
+            self.adeepseek_client = AsyncOpenAI(**deepseek_args)
 
         self.model_name = settings.MODEL_NAME
         self.max_tokens = settings.MAX_TOKENS
         self.temperature = settings.TEMPERATURE
+        self.service_tier = settings.OPENAI_SERVICE_TIER or NOT_GIVEN
+
+        self.response_cache = LLMCache()
+        self.semantic_cache: Optional[SemanticCache] = None
+        if settings.SEMANTIC_CACHE_ENABLED:
+            self.semantic_cache = SemanticCache(
+                embed=self._embed,
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+            )
+
+    def _embed(self, text: str) -> Embedding:
+        """Embed text with the configured OpenAI embedding model."""
+        response = self.client.embeddings.create(
+            model=settings.EMBEDDING_MODEL, input=text
+        )
+        return response.data[0].embedding
+
+    def _semantic_lookup(
+        self, messages: List[Message], max_tokens: int
+    ) -> Tuple[Optional[str], str, Optional[Embedding]]:
+        """
+        Look up a semantically similar prior response.
+
+        Requests are only compared against others with the same model, sampling
+        parameters and system prompt; the remaining messages are embedded.
+        """
+        system_prompt = "\n".join(
+            m["content"] for m in messages if m.get("role") == "system"
+        )
+        bucket = SemanticCache.bucket_key(
+            self.model_name, self.temperature, max_tokens, system_prompt
+        )
+        text = "\n".join(
+            f"{m['role']}: {m['content']}"
+            for m in messages
+            if m.get("role") != "system"
+        )
+        try:
+            cached, embedding = self.semantic_cache.lookup(bucket, text)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {str(e)}")
+            return None, bucket, None
+        return cached, bucket, embedding
+
+    def _check_caches(self, messages: List[Message], max_tokens: int) -> _CacheLookup:
+        """Check the exact-match and semantic caches before calling the provider."""
+        lookup = _CacheLookup()
+
+        # Temperature 0 completions are deterministic, so identical requests can
+        # be answered from an exact-match cache.
+        if self.temperature == 0:
+            lookup.key = LLMCache.make_key(
+                model=self.model_name,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=max_tokens,
+            )
+            lookup.response = self.response_cache.get(lookup.key)
+            if lookup.response is not None:
+                return lookup
+
+        if self.semantic_cache is not None:
+            lookup.response, lookup.bucket, lookup.embedding = self._semantic_lookup(
+                messages, max_tokens
+            )
+            if lookup.response is not None:
+                logger.debug("Semantic cache hit")
+
+        return lookup
+
+    async def _acheck_caches(
+        self, messages: List[Message], max_tokens: int
+    ) -> _CacheLookup:
+        """Async version of ``_check_caches``."""
+        if self.semantic_cache is not None:
+            # The semantic lookup makes a blocking embeddings call
+            return await asyncio.to_thread(self._check_caches, messages, max_tokens)
+        return self._check_caches(messages, max_tokens)
+
+    def _fill_caches(self, lookup: _CacheLookup, content: str) -> None:
+        """Store a fresh completion in the caches that missed."""
+        if lookup.key is not None:
+            self.response_cache.set(lookup.key, content)
+        if self.semantic_cache is not None and lookup.embedding is not None:
+            self.semantic_cache.store(lookup.bucket, lookup.embedding, content)
+
+    @staticmethod
+    def _prepare_messages(
+        prompt: Optional[str], messages: Optional[List[Message]]
+    ) -> List[Message]:
+        """Build the message list for a chat completion request."""
+        # Convert prompt to messages format if messages not provided
+        if messages is None:
+            if prompt is None:
+                raise ValueError("Either prompt or messages must be provided")
+
+            # Use default system message with prompt
+            return [DEFAULT_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+        # If no system message is included, add the default one without
+        # modifying the caller's list
+        has_system_message = any(msg.get("role") == "system" for msg in messages)
+        if not has_system_message:
+            return [DEFAULT_SYSTEM_MESSAGE, *messages]
+        return messages
+
+    def _completion_text(self, response: Any, lookup: _CacheLookup) -> str:
+        """Extract the text of a chat completion and cache it."""
+        if response.choices and len(response.choices) > 0:
+            content = response.choices[0].message.content or ""
+            self._fill_caches(lookup, content)
+            return content
+        return "No response generated."
 
     def generate_response(
         self,
@@ -105,40 +349,120 @@ class AIClient:
             OpenAIError: If there's an error with the OpenAI API
             ValueError: If neither prompt nor messages are provided
         """
-        # Convert prompt to messages format if messages not provided
-        if messages is None:
-            if prompt is None:
-                raise ValueError("Either prompt or messages must be provided")
+        messages = self._prepare_messages(prompt, messages)
+        max_tokens = max_tokens or self.max_tokens
 
-            # Use default system message with prompt
-            messages = [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": prompt},
-            ]
-        else:
-            # If no system message is included, add the default one
-            has_system_message = any(msg.get("role") == "system" for msg in messages)
-            if not has_system_message:
-                messages.insert(
-                    0, {"role": "system", "content": "You are a helpful assistant."}
-                )
+        lookup = self._check_caches(messages, max_tokens)
+        if lookup.response is not None:
+            return lookup.response
 
         try:
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=messages,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=self.temperature,
+            response = _call_with_retries(
+                lambda: self.client.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    service_tier=self.service_tier,
+                )
             )
+            return self._completion_text(response, lookup)
+
+        except Exception as e:
+            logger.error(f"Error generating OpenAI response: {str(e)}", exc_info=True)
+            raise OpenAIError(f"Error generating AI response: {str(e)}") from e
+
+    async def agenerate_response(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> str:
+        """
+        Async version of ``generate_response``.
 
-            if response.choices and len(response.choices) > 0:
-                return response.choices[0].message.content or ""
-            return "No response generated."
+        Independent requests can be overlapped with ``asyncio.gather``.
+
+        Raises:
+            OpenAIError: If there's an error with the OpenAI API
+            ValueError: If neither prompt nor messages are provided
+        """
+        messages = self._prepare_messages(prompt, messages)
+        max_tokens = max_tokens or self.max_tokens
+
+        lookup = await self._acheck_caches(messages, max_tokens)
+        if lookup.response is not None:
+            return lookup.response
+
+        try:
+            response = await _call_with_limits(
+                "openai",
+                lambda: self.aclient.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    service_tier=self.service_tier,
+                ),
+            )
+            return self._completion_text(response, lookup)
 
         except Exception as e:
             logger.error(f"Error generating OpenAI response: {str(e)}", exc_info=True)
             raise OpenAIError(f"Error generating AI response: {str(e)}") from e
 
+    async def agenerate_response_stream(
+        self,
+        prompt: Optional[str] = None,
+        messages: Optional[List[Message]] = None,
+        max_tokens: Optional[int] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a response from the AI model as it is generated.
+
+        Yields content deltas as they arrive, so callers can start using the
+        beginning of the response before it is complete. A cached response is
+        yielded as a single chunk.
+
+        Raises:
+            OpenAIError: If there's an error with the OpenAI API
+            ValueError: If neither prompt nor messages are provided
+        """
+        messages = self._prepare_messages(prompt, messages)
+        max_tokens = max_tokens or self.max_tokens
+
+        lookup = await self._acheck_caches(messages, max_tokens)
+        if lookup.response is not None:
+            yield lookup.response
+            return
+
+        parts: List[str] = []
+        try:
+            stream = await _call_with_limits(
+                "openai",
+                lambda: self.aclient.chat.completions.create(
+                    model=self.model_name,
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=self.temperature,
+                    service_tier=self.service_tier,
+                    stream=True,
+                ),
+            )
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
+
+        except Exception as e:
+            logger.error(f"Error streaming OpenAI response: {str(e)}", exc_info=True)
+            raise OpenAIError(f"Error generating AI response: {str(e)}") from e
+
+        self._fill_caches(lookup, "".join(parts))
+
     def generate_with_gemini(self, input_data: str) -> str:
         """
         Make an API call to Google's Gemini AI model.
@@ -153,28 +477,51 @@ class AIClient:
             InvalidAPIKeyError: If the Gemini API key is not configured
             GeminiError: If there's an error with the Gemini API
         """
-        if not settings.GEMINI_API_KEY:
+        if self.gemini_client is None:
             raise InvalidAPIKeyError(
                 "Gemini API key not found in settings. "
                 "Please add GEMINI_API_KEY to your .env file."
             )
 
         try:
-            client = genai.Client(api_key=settings.GEMINI_API_KEY)
-            response = client.models.generate_content(
-                model=settings.GEMINI_MODEL,
-                contents=input_data,
+            response = _call_with_retries(
+                lambda: self.gemini_client.models.generate_content(
+                    model=settings.GEMINI_MODEL,
+                    contents=input_data,
+                )
+            )
+            return response.text
+        except Exception as e:
+            logger.error(f"Error generating Gemini response: {str(e)}", exc_info=True)
+            raise GeminiError(f"Error generating Gemini response: {str(e)}") from e
+
+    async def agenerate_with_gemini(self, input_data: str) -> str:
+        """
+        Async version of ``generate_with_gemini``.
+
+        Raises:
+            InvalidAPIKeyError: If the Gemini API key is not configured
+            GeminiError: If there's an error with the Gemini API
+        """
+        if self.gemini_client is None:
+            raise InvalidAPIKeyError(
+                "Gemini API key not found in settings. "
+                "Please add GEMINI_API_KEY to your .env file."
+            )
+
+        try:
+            response = await _call_with_limits(
+                "gemini",
+                lambda: self.gemini_client.aio.models.generate_content(
+                    model=settings.GEMINI_MODEL,
+                    contents=input_data,
+                ),
             )
             return response.text
         except Exception as e:
             logger.error(f"Error generating Gemini response: {str(e)}", exc_info=True)
             raise GeminiError(f"Error generating Gemini response: {str(e)}") from e
 
-    @retry(
-        stop=stop_after_attempt(1),  # Initial attempt + retries combined
-        wait=wait_fixed(0.2),  # Wait 0.2 second between retries
-        retry=retry_if_exception_type(Exception),
-    )
     def generate_with_deepseek(self, prompt: str) -> str:
         """
         Generate a response using Deepseek's API.
@@ -189,27 +536,53 @@ class AIClient:
             InvalidAPIKeyError: If the Deepseek API key is not configured
             DeepseekError: If there's an error with the Deepseek API
         """
-        if not settings.DEEPSEEK_API_KEY:
+        if self.deepseek_client is None:
             raise InvalidAPIKeyError(
                 "Deepseek API key not found in settings. "
                 "Please add DEEPSEEK_API_KEY to your .env file."
             )
 
-        system_prompt = settings.DEEPSEEK_SYSTEM_PROMPT
-
         try:
-            client = OpenAI(
-                api_key=settings.DEEPSEEK_API_KEY,
-                base_url="https://api.deepseek.com",
+            response = _call_with_retries(
+                lambda: self.deepseek_client.chat.completions.create(
+                    model=settings.DEEPSEEK_MODEL,
+                    messages=[
+                        _DEEPSEEK_SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt},
+                    ],
+                    stream=False,
+                )
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            logger.error(f"Error generating Deepseek response: {str(e)}", exc_info=True)
+            raise DeepseekError(f"Error generating Deepseek response: {str(e)}") from e
+
+    async def agenerate_with_deepseek(self, prompt: str) -> str:
+        """
+        Async version of ``generate_with_deepseek``.
+
+        Raises:
+            InvalidAPIKeyError: If the Deepseek API key is not configured
+            DeepseekError: If there's an error with the Deepseek API
+        """
+        if self.adeepseek_client is None:
+            raise InvalidAPIKeyError(
+                "Deepseek API key not found in settings. "
+                "Please add DEEPSEEK_API_KEY to your .env file."
             )
 
-            response = client.chat.completions.create(
-                model=settings.DEEPSEEK_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": prompt},
-                ],
-                stream=False,
+        try:
+            response = await _call_with_limits(
+                "deepseek",
+                lambda: self.adeepseek_client.chat.completions.create(
+                    model=settings.DEEPSEEK_MODEL,
+                    messages=[
+                        _DEEPSEEK_SYSTEM_MESSAGE,
+                        {"role": "user", "content": prompt},
+                    ],
+                    stream=False,
+                ),
             )
             return response.choices[0].message.content
         except Exception as e:
@@ -217,4 +590,24 @@ class AIClient:
             raise DeepseekError(f"Error generating Deepseek response: {str(e)}") from e
 
 
-default_client = AIClient()
+_default_client: Optional[AIClient] = None
+
+
+def get_default_client() -> AIClient:
+    """
+    Get the shared AI client, creating it on first use.
+
+    Returns:
+        The shared AIClient instance
+    """
+    global _default_client
+    if _default_client is None:
+        _default_client = AIClient()
+    return _default_client
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``default_client`` lazily for existing imports."""
+    if name == "default_client":
+        return get_default_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
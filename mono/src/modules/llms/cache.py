@@ -0,0 +1,246 @@
+"""
+LLM Response Caches
+
+This module provides in-process caches that let the AI client skip provider
+round-trips for prompts it has already answered.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import orjson
+
+Embedding = Union[Sequence[float], np.ndarray]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+
+class LLMCache:
+    """
+    Exact-match cache for deterministic (temperature 0) completions.
+
+    Keys are hashes of the full request parameters, so a hit skips the provider
+    call entirely without computing any embedding.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries (least recently used go first)
+            ttl_seconds: Seconds before an entry expires
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._pending: Dict[str, "Future[str]"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(**params: Any) -> str:
+        """Build a cache key from request parameters."""
+        payload = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response under ``key``."""
+        with self._lock:
+            self._entries[key] = (response, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_set(self, key: str, compute: Callable[[], str]) -> str:
+        """
+        Return the cached response for ``key``, computing it on a miss.
+
+        Concurrent misses for the same key share a single ``compute`` call, so
+        identical requests arriving together reach the provider once. Empty
+        responses are returned but not cached.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                future: "Future[str]" = Future()
+                self._pending[key] = future
+        if pending is not None:
+            return pending.result()
+
+        try:
+            response = compute()
+            if response:
+                self.set(key, response)
+            future.set_result(response)
+            return response
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+
+
+def _normalize(vector: Embedding) -> np.ndarray:
+    """Scale a vector to unit length so a dot product is the cosine similarity."""
+    array = np.asarray(vector, dtype=np.float32)
+    norm = np.linalg.norm(array)
+    if norm == 0:
+        return array
+    return array / norm
+
+
+class _Bucket:
+    """Embeddings of one bucket stored as rows of a preallocated matrix."""
+
+    def __init__(self, dim: int, capacity: int) -> None:
+        self.embeddings = np.empty((capacity, dim), dtype=np.float32)
+        self.created_at = np.empty(capacity, dtype=np.float64)
+        self.last_used = np.empty(capacity, dtype=np.int64)
+        self.responses: List[str] = []
+
+    def grow(self, capacity: int) -> None:
+        """Enlarge the preallocated arrays, keeping existing rows."""
+        size = len(self.responses)
+        for name in ("embeddings", "created_at", "last_used"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:size] = old[:size]
+            setattr(self, name, new)
+
+
+class SemanticCache:
+    """
+    Cache that returns a stored completion for prompts similar to a previous one.
+
+    Entries are grouped into buckets (e.g. per model, temperature and system
+    prompt) so that only comparable requests are matched. Each bucket keeps its
+    normalized embeddings in one matrix, so a lookup is a single matrix-vector
+    product.
+    """
+
+    def __init__(
+        self,
+        embed: Callable[[str], Embedding],
+        threshold: float = 0.92,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            embed: Function returning an embedding vector for a piece of text
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum entries kept per bucket (least recently used go first)
+            ttl_seconds: Seconds before an entry expires
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        self._buckets: Dict[str, _Bucket] = {}
+        self._clock = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def bucket_key(*parts: object) -> str:
+        """
+        Build a bucket key from the parameters that must match exactly.
+
+        Memoized, since the parts repeat across requests and include the full
+        system prompt, which would otherwise be hashed on every lookup.
+        """
+        return hashlib.sha256("|".join(str(p) for p in parts).encode()).hexdigest()
+
+    def _tick(self) -> int:
+        self._clock += 1
+        return self._clock
+
+    def lookup(self, bucket: str, text: str) -> Tuple[Optional[str], np.ndarray]:
+        """
+        Find a cached response for text similar to ``text``.
+
+        Returns:
+            The cached response (or None on a miss) and the normalized embedding,
+            which callers pass back to ``store`` to avoid embedding twice.
+        """
+        embedding = _normalize(self._embed(text))
+        now = time.monotonic()
+
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is not None and entries.responses:
+                size = len(entries.responses)
+                scores = entries.embeddings[:size] @ embedding
+                scores[now - entries.created_at[:size] > self.ttl_seconds] = -np.inf
+                best = int(np.argmax(scores))
+                if scores[best] >= self.threshold:
+                    entries.last_used[best] = self._tick()
+                    self.stats.hits += 1
+                    return entries.responses[best], embedding
+
+            self.stats.misses += 1
+            return None, embedding
+
+    def store(self, bucket: str, embedding: Embedding, response: str) -> None:
+        """Store a response under an embedding returned by ``lookup``."""
+        embedding = np.asarray(embedding, dtype=np.float32)
+        now = time.monotonic()
+
+        with self._lock:
+            entries = self._buckets.get(bucket)
+            if entries is None:
+                entries = _Bucket(len(embedding), min(16, self.max_entries))
+                self._buckets[bucket] = entries
+
+            size = len(entries.responses)
+            if size < self.max_entries:
+                if size == len(entries.embeddings):
+                    entries.grow(min(size * 2, self.max_entries))
+                row = size
+                entries.responses.append(response)
+            else:
+                # Reuse an expired slot if there is one, else the least recently used
+                last_used = entries.last_used.copy()
+                last_used[now - entries.created_at > self.ttl_seconds] = -1
+                row = int(np.argmin(last_used))
+                entries.responses[row] = response
+
+            entries.embeddings[row] = embedding
+            entries.created_at[row] = now
+            entries.last_used[row] = self._tick()
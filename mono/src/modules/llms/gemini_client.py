@@ -1,26 +1,32 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 from google import genai
 
-load_dotenv()
-load_dotenv(".env.local", override=True)
+DEFAULT_GEMINI_MODEL = "models/gemini-2.5-flash"
 
-GEMINI_MODEL = os.getenv("GEMINI_MODEL", "models/gemini-2.5-flash")
+
+@lru_cache(maxsize=None)
+def _load_env() -> None:
+    load_dotenv()
+    load_dotenv(".env.local", override=True)
 
 
 class GeminiClient:
     def __init__(self) -> None:
+        _load_env()
         api_key = os.getenv("GEMINI_API_KEY")
         if not api_key:
             raise EnvironmentError(
                 "GEMINI_API_KEY not set. Add it to your .env.local file."
             )
+        self.model = os.getenv("GEMINI_MODEL", DEFAULT_GEMINI_MODEL)
         self.client = genai.Client(api_key=api_key)
 
     def ask(self, prompt: str) -> str:
         response = self.client.models.generate_content(
-            model=GEMINI_MODEL,
+            model=self.model,
             contents=prompt,
         )
         return response.text
@@ -4,14 +4,16 @@ Text Processor Module
 This module provides functionality for processing text using AI models.
 """
 
-from src.modules.llms.ai_client import default_client
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from src.modules.llms.ai_client import get_default_client
 from src.modules.text_processor.repositories import get_session_repository
 from src.modules.text_processor.service import TextProcessorService
+from src.utils.settings import settings
 
-# Create a singleton instance of the text processor service
-_text_processor_service = TextProcessorService(
-    session_repository=get_session_repository(), ai_client=default_client
-)
+# Singleton instance, created on first use
+_text_processor_service: Optional[TextProcessorService] = None
 
 
 def get_text_processor_service() -> TextProcessorService:
@@ -21,4 +23,17 @@ def get_text_processor_service() -> TextProcessorService:
     Returns:
         Text processor service instance
     """
+    global _text_processor_service
+    if _text_processor_service is None:
+        # A single worker keeps each session's saves in submission order
+        save_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-save")
+            if settings.SESSION_SAVE_IN_BACKGROUND
+            else None
+        )
+        _text_processor_service = TextProcessorService(
+            session_repository=get_session_repository(),
+            ai_client=get_default_client(),
+            save_executor=save_executor,
+        )
     return _text_processor_service
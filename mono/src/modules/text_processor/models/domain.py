@@ -4,30 +4,72 @@ Text Processor Domain Models
 This module contains the domain models for the text processor.
 """
 
-from typing import Dict, List, Optional
+import dataclasses
+from collections import deque
+from functools import partial
+from typing import Deque, Dict, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+from pydantic.dataclasses import dataclass
 
+# Messages kept in a session's history besides its system message
+MAX_HISTORY = 8
 
-class Message(BaseModel):
-    """A message in a conversation."""
+
+@dataclass(slots=True, frozen=True)
+class Message:
+    """
+    A message in a conversation.
+
+    Sessions hold many of these, so they are slotted to avoid a per-instance
+    ``__dict__``. Being immutable, one instance can be shared across sessions.
+    """
 
     role: str = Field(
         ..., description="Role of the message sender (system, user, assistant)"
     )
     content: str = Field(..., description="Content of the message")
+    api_message: Dict[str, str] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Build the API form once so every turn can resend it without copying."""
+        object.__setattr__(
+            self, "api_message", {"role": self.role, "content": self.content}
+        )
 
 
-class SessionState(BaseModel):
-    """State of a text processing session."""
+@dataclass(slots=True)
+class SessionState:
+    """
+    State of a text processing session.
+
+    Updated on every turn, so it is a slotted dataclass: fields are validated on
+    construction, while later assignments are plain attribute writes.
+    """
 
     last_response: str = Field(
         default="", description="Last response from the assistant"
     )
-    history: List[Message] = Field(
-        default_factory=list, description="Conversation history"
+    system_message: Optional[Message] = Field(
+        None, description="System message the conversation was started with"
+    )
+    history: Deque[Message] = Field(
+        default_factory=partial(deque, maxlen=MAX_HISTORY),
+        description="Most recent conversation turns, excluding the system message",
     )
 
+    @field_validator("history")
+    @classmethod
+    def bound_history(cls, history: Deque[Message]) -> Deque[Message]:
+        """Keep only the last MAX_HISTORY messages."""
+        return deque(history, maxlen=MAX_HISTORY)
+
+    def add_message(self, message: Message) -> None:
+        """Append a message; the oldest one is dropped once history is full."""
+        self.history.append(message)
+
 
 class ProcessingResult(BaseModel):
     """Result of text processing."""
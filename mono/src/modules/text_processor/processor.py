@@ -3,9 +3,9 @@ Text Processor Module
 
 This module contains functionality for text processing using an LLM with minimal context.
 The implementation demonstrates a simple conversational workflow where:
-1. Only the last response from the LLM is stored in the session state
-2. This last response is included in the next prompt to provide minimal context
-3. The system message guides the LLM to perform as a calculator for demo purposes
+1. The first input establishes the text the session works on
+2. Later inputs are instructions that transform the current text
+3. Only the last few turns are kept in the session state as context
 """
 from typing import Optional
 
@@ -8,9 +8,13 @@ from src.modules.text_processor.repositories.interfaces import SessionRepository
 from src.modules.text_processor.repositories.memory_repositories import (
     InMemorySessionRepository,
 )
+from src.utils.settings import settings
 
 # Singleton instance
-_session_repository: SessionRepository = InMemorySessionRepository()
+_session_repository: SessionRepository = InMemorySessionRepository(
+    max_sessions=settings.SESSION_CACHE_MAX,
+    ttl_seconds=settings.SESSION_TTL_SECONDS,
+)
 
 
 def get_session_repository() -> SessionRepository:
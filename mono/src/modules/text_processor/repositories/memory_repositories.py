@@ -4,17 +4,43 @@ In-Memory Repository Implementations
 This module implements in-memory repositories for the Text Processor.
 """
 
+import threading
+import time
+from collections import OrderedDict
+from itertools import islice
 from typing import Dict
 
 from src.modules.text_processor.models.domain import SessionState
 
+# Number of least recently used sessions compared by use count on eviction
+_EVICTION_SAMPLE = 8
+
 
 class InMemorySessionRepository:
-    """In-memory implementation of the session repository."""
+    """
+    In-memory implementation of the session repository.
+
+    Sessions are kept in least-recently-used order. Once ``max_sessions`` is
+    exceeded, the least used of the oldest few sessions is evicted, so active
+    conversations outlive one-off visitors. Sessions untouched for
+    ``ttl_seconds`` are dropped so abandoned conversations do not hold memory
+    until pushed out.
+    """
 
-    def __init__(self) -> None:
-        """Initialize the repository with an empty storage dictionary."""
-        self._storage: Dict[str, SessionState] = {}
+    def __init__(self, max_sessions: int = 10_000, ttl_seconds: float = 3600) -> None:
+        """
+        Initialize the repository with an empty storage dictionary.
+
+        Args:
+            max_sessions: Maximum number of sessions kept in memory
+            ttl_seconds: Seconds of inactivity before a session expires
+        """
+        self._max_sessions = max_sessions
+        self._ttl_seconds = ttl_seconds
+        self._storage: "OrderedDict[str, SessionState]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._uses: Dict[str, int] = {}
+        self._lock = threading.Lock()
 
     def get_session(self, session_id: str) -> SessionState:
         """
@@ -26,9 +52,14 @@ class InMemorySessionRepository:
         Returns:
             Session state
         """
-        if session_id not in self._storage:
-            self._storage[session_id] = SessionState()
-        return self._storage[session_id]
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            state = self._storage.get(session_id)
+            if state is None:
+                state = SessionState()
+            self._store(session_id, state, now)
+            return state
 
     def save_session(self, session_id: str, state: SessionState) -> None:
         """
@@ -38,7 +69,43 @@ class InMemorySessionRepository:
             session_id: Unique session identifier
             state: Session state to save
         """
+        with self._lock:
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._store(session_id, state, now)
+
+    def _store(self, session_id: str, state: SessionState, now: float) -> None:
+        """Store a session as the most recently used, evicting if over capacity."""
         self._storage[session_id] = state
+        self._storage.move_to_end(session_id)
+        self._touched[session_id] = now
+        self._uses[session_id] = self._uses.get(session_id, 0) + 1
+        while len(self._storage) > self._max_sessions:
+            self._evict_least_used()
+
+    def _evict_least_used(self) -> None:
+        """Evict the least used of the least recently used sessions."""
+        # The session just stored is only a candidate if it is the only one
+        sample = max(1, min(_EVICTION_SAMPLE, len(self._storage) - 1))
+        evicted = min(
+            islice(self._storage, sample), key=lambda sid: self._uses.get(sid, 0)
+        )
+        self._remove(evicted)
+
+    def _remove(self, session_id: str) -> bool:
+        """Remove a session and its bookkeeping, returning whether it existed."""
+        self._touched.pop(session_id, None)
+        self._uses.pop(session_id, None)
+        return self._storage.pop(session_id, None) is not None
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop sessions idle for longer than the TTL, oldest first."""
+        cutoff = now - self._ttl_seconds
+        while self._storage:
+            oldest = next(iter(self._storage))
+            if self._touched.get(oldest, now) > cutoff:
+                break
+            self._remove(oldest)
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -50,7 +117,5 @@ class InMemorySessionRepository:
         Returns:
             True if the session was deleted, False if it didn't exist
         """
-        if session_id in self._storage:
-            del self._storage[session_id]
-            return True
-        return False
+        with self._lock:
+            return self._remove(session_id)
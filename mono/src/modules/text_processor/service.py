@@ -4,12 +4,16 @@ Text Processor Service
 Implements text transformation functionality using LLMs with conversation history.
 """
 
-import json
+import asyncio
 import logging
+import re
+import threading
+from concurrent.futures import Executor, Future
 from typing import Any, Dict, List, Optional
 
 from src.modules.llms import AIClientError
 from src.modules.llms.ai_client import AIClient, Message
+from src.modules.llms.cache import LLMCache
 from src.modules.text_processor.models.domain import Message as DomainMessage
 from src.modules.text_processor.models.domain import ProcessingResult, SessionState
 from src.modules.text_processor.repositories.interfaces import SessionRepository
@@ -17,14 +21,240 @@ from src.modules.text_processor.repositories.interfaces import SessionRepository
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+_TRANSFORMED_LINE = re.compile(r"^Transformed:\s*(.+)$", re.MULTILINE)
+
+# Assistant replies containing any of these phrases ask for input instead of
+# holding text state
+_ASKS_FOR_INPUT = re.compile(
+    r"provide some text|establish|initial state|text to work with", re.IGNORECASE
+)
+
+# System prompts are module constants so every request sends an identical,
+# cacheable prefix
+_TRANSFORM_SYSTEM = (
+    "You are an expert text transformer. Given the current text and a user's message, "
+    "work out what transformation they want and apply it.\n\n"
+    "INSTRUCTIONS:\n"
+    "1. Identify the transformation type and its parameters\n"
+    "2. Apply the transformation exactly as requested\n"
+    "3. Preserve all attributes not mentioned in the request\n"
+    "4. Maintain natural language flow and readability\n\n"
+    "TRANSFORMATION CATEGORIES:\n"
+    "COLOR_CHANGE, SIZE_CHANGE, OBJECT_SUBSTITUTION, QUANTITY_CHANGE, ATTRIBUTE_ADD, "
+    "ATTRIBUTE_REMOVE, GRAMMAR_CHANGE, STYLE_CHANGE, COMPLEX_MODIFICATION\n\n"
+    "OUTPUT FORMAT:\n"
+    "Category: [TRANSFORMATION_CATEGORY]\n"
+    "Intent: [Clear description of what to change]\n"
+    "Specifics: [Detailed parameters for the transformation]\n"
+    "Transformed: [ONLY the final transformed text]\n\n"
+    "EXAMPLES:\n"
+    "Current text: 'a blue car'\n"
+    "User: 'make it red'\n"
+    "Output:\n"
+    "Category: COLOR_CHANGE\n"
+    "Intent: Change the color from blue to red\n"
+    "Specifics: Replace 'blue' with 'red' while keeping all other attributes\n"
+    "Transformed: a red car\n\n"
+    "Current text: 'a small dog'\n"
+    "User: 'add wings and make it purple'\n"
+    "Output:\n"
+    "Category: COMPLEX_MODIFICATION\n"
+    "Intent: Add wings to the dog and change its color to purple\n"
+    "Specifics: Add 'wings' as an attribute and change color to 'purple' while keeping size 'small'\n"
+    "Transformed: a small purple dog with wings"
+)
+
+_INTENT_SYSTEM = (
+    "You are an expert at analyzing user intent for text transformations. "
+    "Given the current text and a user's message, identify what transformation they want to perform.\n\n"
+    "Your job is to:\n"
+    "1. Understand what the user wants to change about the current text\n"
+    "2. Identify the specific transformation type and parameters\n"
+    "3. Provide a clear, actionable description of the intent\n\n"
+    "TRANSFORMATION CATEGORIES:\n"
+    "- COLOR_CHANGE: Change color of object (e.g., 'make it red', 'change to blue')\n"
+    "- SIZE_CHANGE: Modify size (e.g., 'make it bigger', 'tiny', 'huge')\n"
+    "- OBJECT_SUBSTITUTION: Replace the main object (e.g., 'make it a cat', 'change to car')\n"
+    "- QUANTITY_CHANGE: Singular/plural changes (e.g., 'make it plural', 'singular')\n"
+    "- ATTRIBUTE_ADD: Add new attributes (e.g., 'add wings', 'with a hat', 'old and rusty')\n"
+    "- ATTRIBUTE_REMOVE: Remove attributes (e.g., 'remove the hat', 'without wings')\n"
+    "- GRAMMAR_CHANGE: Tense or grammatical changes (e.g., 'past tense', 'future tense')\n"
+    "- STYLE_CHANGE: Stylistic modifications (e.g., 'more formal', 'casual tone')\n"
+    "- COMPLEX_MODIFICATION: Multiple changes or complex instructions\n\n"
+    "OUTPUT FORMAT:\n"
+    "Category: [TRANSFORMATION_CATEGORY]\n"
+    "Intent: [Clear description of what to change]\n"
+    "Specifics: [Detailed parameters for the transformation]\n\n"
+    "EXAMPLES:\n"
+    "Current text: 'a blue car'\n"
+    "User: 'make it red'\n"
+    "Output:\n"
+    "Category: COLOR_CHANGE\n"
+    "Intent: Change the color from blue to red\n"
+    "Specifics: Replace 'blue' with 'red' while keeping all other attributes\n\n"
+    "Current text: 'a small dog'\n"
+    "User: 'add wings and make it purple'\n"
+    "Output:\n"
+    "Category: COMPLEX_MODIFICATION\n"
+    "Intent: Add wings to the dog and change its color to purple\n"
+    "Specifics: Add 'wings' as an attribute and change color to 'purple' while keeping size 'small'"
+)
+
+_EXEC_SYSTEM = (
+    "You are an expert text transformer. Your job is to modify text based on analyzed intent.\n\n"
+    "INSTRUCTIONS:\n"
+    "1. You will receive the current text and an intent analysis\n"
+    "2. Apply the transformation exactly as described in the intent\n"
+    "3. Preserve all attributes not mentioned in the transformation\n"
+    "4. Return ONLY the final transformed text, no explanations\n"
+    "5. Maintain natural language flow and readability\n\n"
+    "TRANSFORMATION PRINCIPLES:\n"
+    "- Be precise: Only change what's explicitly requested\n"
+    "- Be conservative: Preserve original structure when possible\n"
+    "- Be natural: Ensure the result reads fluently\n"
+    "- Be consistent: Apply transformations uniformly\n\n"
+    "EXAMPLES:\n"
+    "Current text: 'a bright blue cow'\n"
+    "Intent: Change color from blue to red\n"
+    "Output: 'a bright red cow'\n\n"
+    "Current text: 'the old house'\n"
+    "Intent: Add wings and make it magical\n"
+    "Output: 'the old magical house with wings'"
+)
+
+_ESTABLISH_SYSTEM = (
+    "You are an expert text transformation assistant. Your job is to establish initial text state.\n\n"
+    "DECISION LOGIC:\n"
+    "1. If the message is CONTENT (descriptive text) → Echo it back to establish state\n"
+    "2. If the message is INSTRUCTION without context → Ask for content first\n\n"
+    "CONTENT vs INSTRUCTION:\n"
+    "CONTENT (can establish state): 'a blue car', 'the tall building', 'children playing'\n"
+    "INSTRUCTIONS (need context): 'make it red', 'bigger', 'with double e'\n\n"
+    "EXAMPLES:\n"
+    "User: 'a bright blue cow' → You: 'a bright blue cow'\n"
+    "User: 'make it purple' → You: 'Please provide some text to establish the initial state, then I can apply transformations like making it purple.'\n"
+    "User: 'with double e' → You: 'Please provide some text content first, then I can modify it with your requested changes.'"
+)
+
+_TRANSFORM_SYSTEM_MSG: Message = {"role": "system", "content": _TRANSFORM_SYSTEM}
+_INTENT_SYSTEM_MSG: Message = {"role": "system", "content": _INTENT_SYSTEM}
+_EXEC_SYSTEM_MSG: Message = {"role": "system", "content": _EXEC_SYSTEM}
+_ESTABLISH_SYSTEM_MSG: Message = {"role": "system", "content": _ESTABLISH_SYSTEM}
+# Stored as every established session's system message
+_ESTABLISH_SYSTEM_DOMAIN_MSG = DomainMessage(role="system", content=_ESTABLISH_SYSTEM)
+
+_TRANSFORM_USER = (
+    "Current text: '{current_text}'\nUser message: '{user_message}'\n\n"
+    "Transform the text:"
+)
+_INTENT_USER = (
+    "Current text: '{current_text}'\nUser message: '{user_message}'\n\n"
+    "Analyze the intent:"
+)
+_EXEC_USER = (
+    "Current text: '{current_text}'\n\nIntent analysis:\n{intent_analysis}\n\n"
+    "Execute the transformation:"
+)
+
+
+def _error_reply(e: Exception) -> str:
+    """Log a failed LLM response and build the reply shown to the user."""
+    if isinstance(e, AIClientError):
+        # An expected failure of the remote call, so no traceback
+        logger.warning("AI client error while generating response: %s", e)
+        return f"I encountered an AI processing issue: {str(e)}"
+    logger.error("Unexpected error generating LLM response: %s", e, exc_info=True)
+    return f"I encountered an unexpected issue: {str(e)}"
+
+
+# Striped locks serialize history reads and updates within a session without a
+# global lock; sessions that share a stripe only contend for the brief update
+_SESSION_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+
+def _session_lock(session_id: Optional[str]) -> threading.Lock:
+    """Get the lock guarding a session's history."""
+    return _SESSION_LOCKS[hash(session_id) % len(_SESSION_LOCKS)]
+
+
+def _log_save_error(future: Future) -> None:
+    """Log the failure of a background session save."""
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Error saving session: %s", exc)
+
 
 class TextProcessorService:
     """Text transformation service that maintains and modifies text state across conversation turns."""
 
-    def __init__(self, session_repository: SessionRepository, ai_client: AIClient):
-        """Initialize with required dependencies."""
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        ai_client: AIClient,
+        response_cache: Optional[LLMCache] = None,
+        debug_two_step: bool = False,
+        save_executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize with required dependencies.
+
+        Args:
+            session_repository: Repository for session state
+            ai_client: Client used for LLM calls
+            response_cache: Cache for identical LLM requests
+            debug_two_step: Analyze intent and transform in separate LLM calls,
+                which exposes the intent analysis on its own
+            save_executor: Executor that saves sessions in the background so the
+                response is returned without waiting for the repository; use a
+                single worker to keep saves ordered. Saves are synchronous if None
+        """
         self.session_repository = session_repository
         self.ai_client = ai_client
+        self.debug_two_step = debug_two_step
+        self.save_executor = save_executor
+        self.response_cache = response_cache or LLMCache(
+            maxsize=10_000, ttl_seconds=3600
+        )
+
+    def _generate(self, messages: List[Message]) -> str:
+        """Generate a response, reusing the answer to an identical request."""
+        return self.response_cache.get_or_set(
+            LLMCache.make_key(messages=messages),
+            lambda: self.ai_client.generate_response(messages=messages),
+        )
+
+    async def _agenerate(self, messages: List[Message]) -> str:
+        """Async version of ``_generate``."""
+        key = LLMCache.make_key(messages=messages)
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.ai_client.agenerate_response(messages=messages)
+        if response:
+            self.response_cache.set(key, response)
+        return response
+
+    def _save_session(self, session_id: str, state: SessionState) -> None:
+        """Save a session, in the background if a save executor is configured."""
+        if self.save_executor is None:
+            self.session_repository.save_session(session_id, state)
+            return
+
+        future = self.save_executor.submit(
+            self.session_repository.save_session, session_id, state
+        )
+        future.add_done_callback(_log_save_error)
+
+    def _load_session(self, session_id: Optional[str]) -> Optional[SessionState]:
+        """Fetch the session state, treating a failing repository as no state."""
+        if not session_id:
+            return None
+        try:
+            return self.session_repository.get_session(session_id)
+        except Exception as e:
+            logger.error("Error getting session %s: %s", session_id, e)
+            return None
 
     def process_text(
         self, text: str, session_id: Optional[str] = None
@@ -44,58 +274,150 @@ class TextProcessorService:
                 response="Please provide some text to work with.", session_id=session_id
             )
 
-        logger.info(f"Processing text: '{text}' for session: {session_id}")
+        logger.info("Processing text: '%s' for session: %s", text, session_id)
 
-        # Check if we have existing text state
-        current_text = self._get_current_text_state(session_id) if session_id else None
+        # Loaded once and shared by every step of this request
+        state = self._load_session(session_id)
+        current_text = None
+        if state is not None:
+            with _session_lock(session_id):
+                current_text = self._get_current_text_state(state)
 
         if current_text:
-            # Two-step process for transformations
-            logger.info(
-                f"Using two-step process for transformation. Current text: '{current_text}'"
-            )
-            response = self._two_step_transformation(text, current_text, session_id)
+            response = self._apply_transformation(text, current_text, session_id, state)
         else:
             # Single-step process for establishing initial state
             logger.info("No existing text state, using single-step process")
-            response = self._generate_llm_response(text, session_id)
+            response = self._generate_llm_response(text, session_id, state)
+
+        logger.info("Generated response: '%s' for session: %s", response, session_id)
+
+        return ProcessingResult(response=response, session_id=session_id)
+
+    async def aprocess_text(
+        self, text: str, session_id: Optional[str] = None
+    ) -> ProcessingResult:
+        """
+        Async version of ``process_text``.
+
+        Establishing text awaits the async AI client. Transformations, which may
+        take several dependent LLM calls, run the sync path on a worker thread.
+        """
+        if not text.strip():
+            return ProcessingResult(
+                response="Please provide some text to work with.", session_id=session_id
+            )
+
+        logger.info("Processing text: '%s' for session: %s", text, session_id)
+
+        state = self._load_session(session_id)
+        current_text = None
+        if state is not None:
+            with _session_lock(session_id):
+                current_text = self._get_current_text_state(state)
+
+        if current_text:
+            response = await asyncio.to_thread(
+                self._apply_transformation, text, current_text, session_id, state
+            )
+        else:
+            logger.info("No existing text state, using single-step process")
+            response = await self._agenerate_llm_response(text, session_id, state)
 
-        logger.info(f"Generated response: '{response}' for session: {session_id}")
+        logger.info("Generated response: '%s' for session: %s", response, session_id)
 
         return ProcessingResult(response=response, session_id=session_id)
 
-    def _get_current_text_state(self, session_id: str) -> Optional[str]:
+    def _apply_transformation(
+        self,
+        text: str,
+        current_text: str,
+        session_id: Optional[str],
+        state: Optional[SessionState],
+    ) -> str:
+        """Transform the current text with the configured process."""
+        logger.info("Transforming current text: '%s'", current_text)
+        if self.debug_two_step:
+            return self._two_step_transformation(text, current_text, session_id, state)
+        return self._transform(text, current_text, session_id, state)
+
+    def _get_current_text_state(self, state: SessionState) -> Optional[str]:
         """Extract the current text state from session history."""
+        if len(state.history) < 2:  # Need at least user + assistant
+            return None
+
+        # Find the last assistant response that contains actual text content
+        for message in reversed(state.history):
+            if message.role == "assistant":
+                response = message.content.strip()
+                # Skip responses that are asking for input
+                if not _ASKS_FOR_INPUT.search(response):
+                    return response
+
+        return None
+
+    def _transform(
+        self,
+        user_message: str,
+        current_text: str,
+        session_id: Optional[str] = None,
+        state: Optional[SessionState] = None,
+    ) -> str:
+        """
+        Analyze intent and execute the transformation in a single LLM call.
+
+        Falls back to the two-step process if the reply has no transformed text.
+
+        Args:
+            user_message: The user's transformation request
+            current_text: The current text state to transform
+            session_id: Optional session identifier
+            state: Session state already loaded for this request, if any
+
+        Returns:
+            The transformed text
+        """
+
+        messages: List[Message] = [
+            _TRANSFORM_SYSTEM_MSG,
+            {
+                "role": "user",
+                "content": _TRANSFORM_USER.format(
+                    current_text=current_text, user_message=user_message
+                ),
+            },
+        ]
+
         try:
-            state = self.session_repository.get_session(session_id)
-            if (
-                not state.history or len(state.history) < 3
-            ):  # Need at least system + user + assistant
-                return None
-
-            # Find the last assistant response that contains actual text content
-            for message in reversed(state.history):
-                if message.role == "assistant":
-                    response = message.content.strip()
-                    # Skip responses that are asking for input
-                    if not any(
-                        phrase in response.lower()
-                        for phrase in [
-                            "provide some text",
-                            "establish",
-                            "initial state",
-                            "text to work with",
-                        ]
-                    ):
-                        return response
+            response = self._generate(messages) or ""
+            match = _TRANSFORMED_LINE.search(response)
+            if not match:
+                logger.warning("No transformed text in reply, using two-step process")
+                return self._two_step_transformation(
+                    user_message, current_text, session_id, state
+                )
+
+            intent_analysis = response[: match.start()].strip()
+            transformed_text = match.group(1).strip()
+            logger.debug("Intent analysis result: %s", intent_analysis)
+
+            if session_id and transformed_text:
+                self._update_session_with_transformation(
+                    session_id, user_message, intent_analysis, transformed_text, state
+                )
+            return transformed_text
 
-            return None
         except Exception as e:
-            logger.error(f"Error getting current text state: {str(e)}")
-            return None
+            logger.error("Error in transformation: %s", e)
+            # Fallback to single-step process
+            return self._generate_llm_response(user_message, session_id, state)
 
     def _two_step_transformation(
-        self, user_message: str, current_text: str, session_id: Optional[str] = None
+        self,
+        user_message: str,
+        current_text: str,
+        session_id: Optional[str] = None,
+        state: Optional[SessionState] = None,
     ) -> str:
         """
         Perform two-step transformation: first analyze intent, then execute transformation.
@@ -104,6 +426,7 @@ class TextProcessorService:
             user_message: The user's transformation request
             current_text: The current text state to transform
             session_id: Optional session identifier
+            state: Session state already loaded for this request, if any
 
         Returns:
             The transformed text
@@ -111,20 +434,20 @@ class TextProcessorService:
         try:
             # Step 1: Analyze intent
             intent_analysis = self._analyze_intent(user_message, current_text)
-            logger.debug(f"Intent analysis result: {intent_analysis}")
+            logger.debug("Intent analysis result: %s", intent_analysis)
 
             # Step 2: Execute transformation
             transformed_text = self._execute_transformation(
-                current_text, intent_analysis, session_id
+                user_message, current_text, intent_analysis, session_id, state
             )
-            logger.debug(f"Transformation result: {transformed_text}")
+            logger.debug("Transformation result: %s", transformed_text)
 
             return transformed_text
 
         except Exception as e:
-            logger.error(f"Error in two-step transformation: {str(e)}")
+            logger.error("Error in two-step transformation: %s", e)
             # Fallback to single-step process
-            return self._generate_llm_response(user_message, session_id)
+            return self._generate_llm_response(user_message, session_id, state)
 
     def _analyze_intent(self, user_message: str, current_text: str) -> str:
         """
@@ -137,213 +460,170 @@ class TextProcessorService:
         Returns:
             Analysis of what the user wants to do
         """
-        system_content = (
-            "You are an expert at analyzing user intent for text transformations. "
-            "Given the current text and a user's message, identify what transformation they want to perform.\n\n"
-            "Your job is to:\n"
-            "1. Understand what the user wants to change about the current text\n"
-            "2. Identify the specific transformation type and parameters\n"
-            "3. Provide a clear, actionable description of the intent\n\n"
-            "TRANSFORMATION CATEGORIES:\n"
-            "- COLOR_CHANGE: Change color of object (e.g., 'make it red', 'change to blue')\n"
-            "- SIZE_CHANGE: Modify size (e.g., 'make it bigger', 'tiny', 'huge')\n"
-            "- OBJECT_SUBSTITUTION: Replace the main object (e.g., 'make it a cat', 'change to car')\n"
-            "- QUANTITY_CHANGE: Singular/plural changes (e.g., 'make it plural', 'singular')\n"
-            "- ATTRIBUTE_ADD: Add new attributes (e.g., 'add wings', 'with a hat', 'old and rusty')\n"
-            "- ATTRIBUTE_REMOVE: Remove attributes (e.g., 'remove the hat', 'without wings')\n"
-            "- GRAMMAR_CHANGE: Tense or grammatical changes (e.g., 'past tense', 'future tense')\n"
-            "- STYLE_CHANGE: Stylistic modifications (e.g., 'more formal', 'casual tone')\n"
-            "- COMPLEX_MODIFICATION: Multiple changes or complex instructions\n\n"
-            "OUTPUT FORMAT:\n"
-            "Category: [TRANSFORMATION_CATEGORY]\n"
-            "Intent: [Clear description of what to change]\n"
-            "Specifics: [Detailed parameters for the transformation]\n\n"
-            "EXAMPLES:\n"
-            "Current text: 'a blue car'\n"
-            "User: 'make it red'\n"
-            "Output:\n"
-            "Category: COLOR_CHANGE\n"
-            "Intent: Change the color from blue to red\n"
-            "Specifics: Replace 'blue' with 'red' while keeping all other attributes\n\n"
-            "Current text: 'a small dog'\n"
-            "User: 'add wings and make it purple'\n"
-            "Output:\n"
-            "Category: COMPLEX_MODIFICATION\n"
-            "Intent: Add wings to the dog and change its color to purple\n"
-            "Specifics: Add 'wings' as an attribute and change color to 'purple' while keeping size 'small'"
-        )
 
         messages: List[Message] = [
-            {"role": "system", "content": system_content},
+            _INTENT_SYSTEM_MSG,
             {
                 "role": "user",
-                "content": f"Current text: '{current_text}'\nUser message: '{user_message}'\n\nAnalyze the intent:",
+                "content": _INTENT_USER.format(
+                    current_text=current_text, user_message=user_message
+                ),
             },
         ]
 
-        response = self.ai_client.generate_response(messages=messages)
+        response = self._generate(messages)
         return response.strip() if response else "Unable to analyze intent"
 
     def _execute_transformation(
-        self, current_text: str, intent_analysis: str, session_id: Optional[str] = None
+        self,
+        user_message: str,
+        current_text: str,
+        intent_analysis: str,
+        session_id: Optional[str] = None,
+        state: Optional[SessionState] = None,
     ) -> str:
         """
         Execute the transformation based on intent analysis.
 
         Args:
+            user_message: The user's transformation request
             current_text: The text to transform
             intent_analysis: The analyzed intent from the first step
             session_id: Optional session identifier
+            state: Session state already loaded for this request, if any
 
         Returns:
             The transformed text
         """
-        system_content = (
-            "You are an expert text transformer. Your job is to modify text based on analyzed intent.\n\n"
-            "INSTRUCTIONS:\n"
-            "1. You will receive the current text and an intent analysis\n"
-            "2. Apply the transformation exactly as described in the intent\n"
-            "3. Preserve all attributes not mentioned in the transformation\n"
-            "4. Return ONLY the final transformed text, no explanations\n"
-            "5. Maintain natural language flow and readability\n\n"
-            "TRANSFORMATION PRINCIPLES:\n"
-            "- Be precise: Only change what's explicitly requested\n"
-            "- Be conservative: Preserve original structure when possible\n"
-            "- Be natural: Ensure the result reads fluently\n"
-            "- Be consistent: Apply transformations uniformly\n\n"
-            "EXAMPLES:\n"
-            "Current text: 'a bright blue cow'\n"
-            "Intent: Change color from blue to red\n"
-            "Output: 'a bright red cow'\n\n"
-            "Current text: 'the old house'\n"
-            "Intent: Add wings and make it magical\n"
-            "Output: 'the old magical house with wings'"
-        )
 
         messages: List[Message] = [
-            {"role": "system", "content": system_content},
+            _EXEC_SYSTEM_MSG,
             {
                 "role": "user",
-                "content": f"Current text: '{current_text}'\n\nIntent analysis:\n{intent_analysis}\n\nExecute the transformation:",
+                "content": _EXEC_USER.format(
+                    current_text=current_text, intent_analysis=intent_analysis
+                ),
             },
         ]
 
-        response = self.ai_client.generate_response(messages=messages)
+        response = self._generate(messages)
         transformed_text = response.strip() if response else current_text
 
         # Update session state with the transformation
         if session_id and transformed_text:
             self._update_session_with_transformation(
-                session_id, intent_analysis, transformed_text
+                session_id, user_message, intent_analysis, transformed_text, state
             )
 
         return transformed_text
 
     def _update_session_with_transformation(
-        self, session_id: str, intent_analysis: str, transformed_text: str
+        self,
+        session_id: str,
+        user_message: str,
+        intent_analysis: str,
+        transformed_text: str,
+        state: Optional[SessionState] = None,
     ) -> None:
-        """Update session state with transformation details."""
+        """Record a transformation turn in the session history."""
         try:
-            state = self.session_repository.get_session(session_id)
-
-            # Add the intent analysis and transformation to history
-            if state.history:
-                # Find the last user message
-                user_message = None
-                for msg in reversed(state.history):
-                    if msg.role == "user":
-                        user_message = msg.content
-                        break
-
-                if user_message:
-                    # Add the final response to history
-                    state.history.append(
-                        DomainMessage(role="assistant", content=transformed_text)
-                    )
-
-                    # Limit history to system message + last 4 exchanges
-                    if len(state.history) > 9:
-                        state.history = [state.history[0]] + state.history[-8:]
-
-                    # Update last_response
-                    state.last_response = transformed_text
-                    self.session_repository.save_session(session_id, state)
-                    logger.debug(
-                        f"Updated session with transformation result for session {session_id}"
-                    )
+            if state is None:
+                state = self.session_repository.get_session(session_id)
+
+            with _session_lock(session_id):
+                if not state.history:
+                    return
+                state.add_message(DomainMessage(role="user", content=user_message))
+                state.add_message(
+                    DomainMessage(role="assistant", content=transformed_text)
+                )
+
+                # Update last_response
+                state.last_response = transformed_text
 
+            self._save_session(session_id, state)
+            logger.debug(
+                "Updated session with transformation result for session %s",
+                session_id,
+            )
         except Exception as e:
-            logger.error(f"Error updating session with transformation: {str(e)}")
+            logger.error("Error updating session with transformation: %s", e)
 
     def _generate_llm_response(
-        self, prompt: str, session_id: Optional[str] = None
+        self,
+        prompt: str,
+        session_id: Optional[str] = None,
+        state: Optional[SessionState] = None,
     ) -> str:
         """
         Generate text transformation response using conversation history.
         Used for establishing initial text state.
         """
         try:
-            # Create system message for text establishment
-            system_content = (
-                "You are an expert text transformation assistant. Your job is to establish initial text state.\n\n"
-                "DECISION LOGIC:\n"
-                "1. If the message is CONTENT (descriptive text) → Echo it back to establish state\n"
-                "2. If the message is INSTRUCTION without context → Ask for content first\n\n"
-                "CONTENT vs INSTRUCTION:\n"
-                "CONTENT (can establish state): 'a blue car', 'the tall building', 'children playing'\n"
-                "INSTRUCTIONS (need context): 'make it red', 'bigger', 'with double e'\n\n"
-                "EXAMPLES:\n"
-                "User: 'a bright blue cow' → You: 'a bright blue cow'\n"
-                "User: 'make it purple' → You: 'Please provide some text to establish the initial state, then I can apply transformations like making it purple.'\n"
-                "User: 'with double e' → You: 'Please provide some text content first, then I can modify it with your requested changes.'"
-            )
-
-            system_message: Message = {"role": "system", "content": system_content}
-            messages: List[Message] = [system_message]
-
-            # Get session state if session_id is provided
-            if session_id:
+            # Get session state if session_id is provided and it isn't loaded yet
+            if state is None and session_id:
                 state = self.session_repository.get_session(session_id)
-                if state.history:
-                    for msg in state.history:
-                        messages.append({"role": msg.role, "content": msg.content})
-
-            # Add the current user message
-            user_message: Message = {"role": "user", "content": prompt}
-            messages.append(user_message)
 
-            response = self.ai_client.generate_response(messages=messages)
+            with _session_lock(session_id):
+                messages = self._establish_messages(prompt, state)
+            # The LLM call runs outside the lock
+            response = self._generate(messages)
+            return self._record_established(prompt, response, session_id, state)
+        except Exception as e:
+            return _error_reply(e)
 
-            # Update session state
-            if session_id and response:
+    async def _agenerate_llm_response(
+        self,
+        prompt: str,
+        session_id: Optional[str] = None,
+        state: Optional[SessionState] = None,
+    ) -> str:
+        """Async version of ``_generate_llm_response``."""
+        try:
+            if state is None and session_id:
                 state = self.session_repository.get_session(session_id)
 
-                if not state.history:
-                    state.history = [
-                        DomainMessage(role="system", content=system_content)
-                    ]
+            with _session_lock(session_id):
+                messages = self._establish_messages(prompt, state)
+            response = await self._agenerate(messages)
+            return self._record_established(prompt, response, session_id, state)
+        except Exception as e:
+            return _error_reply(e)
+
+    @staticmethod
+    def _establish_messages(
+        prompt: str, state: Optional[SessionState]
+    ) -> List[Message]:
+        """Build the request for establishing text state."""
+        history = state.history if state is not None else []
+        return [
+            _ESTABLISH_SYSTEM_MSG,
+            *[msg.api_message for msg in history],
+            {"role": "user", "content": prompt},
+        ]
 
-                state.history.append(DomainMessage(role="user", content=prompt))
-                state.history.append(
-                    DomainMessage(role="assistant", content=response.strip())
-                )
+    def _record_established(
+        self,
+        prompt: str,
+        response: str,
+        session_id: Optional[str],
+        state: Optional[SessionState],
+    ) -> str:
+        """Record an establishing turn in the session and return the reply."""
+        if not response:
+            return "No response generated"
 
-                # Limit history
-                if len(state.history) > 9:
-                    state.history = [state.history[0]] + state.history[-8:]
+        response = response.strip()
+        if state is not None:
+            with _session_lock(session_id):
+                if state.system_message is None:
+                    state.system_message = _ESTABLISH_SYSTEM_DOMAIN_MSG
 
-                state.last_response = response.strip()
-                self.session_repository.save_session(session_id, state)
+                state.add_message(DomainMessage(role="user", content=prompt))
+                state.add_message(DomainMessage(role="assistant", content=response))
 
-            return response.strip() if response else "No response generated"
+                state.last_response = response
 
-        except AIClientError as e:
-            logger.error(
-                f"AI client error while generating response: {str(e)}", exc_info=True
-            )
-            return f"I encountered an AI processing issue: {str(e)}"
-        except Exception as e:
-            logger.error(
-                f"Unexpected error generating LLM response: {str(e)}", exc_info=True
-            )
-            return f"I encountered an unexpected issue: {str(e)}"
+            self._save_session(session_id, state)
+
+        return response
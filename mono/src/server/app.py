@@ -2,6 +2,7 @@
 Flask Application with Socket.IO support for real-time communication.
 """
 import argparse
+import atexit
 import logging
 import logging.config
 import os
@@ -10,18 +11,34 @@ from typing import Any, Dict, NoReturn
 from flask import Flask
 from flask_cors import CORS
 
-# Import blueprints
-from src.server.routes import langchain_bp, main_bp, mcp_server_bp, text_processor_bp
-from src.server.routes.experiments.audio_processor import audio_processor_bp
+from src.server import routes
 
 # Import SocketIO instance
 from src.server.socketio_instance import init_socketio, socketio
+from src.server.utils.json_provider import ORJSONProvider
+from src.utils.settings import settings
+
+# Set once the handlers and queue listener exist for this process
+_logging_configured = False
 
 
 def setup_logging(debug: bool = False) -> None:
-    """Configure hierarchical logging with console output."""
+    """
+    Configure hierarchical logging with console output.
+
+    Records are queued and written to the console by a listener thread, so
+    request threads never block on stdout. Handlers and the listener are set up
+    once per process; later calls only adjust the log level.
+    """
+    global _logging_configured
     log_level = logging.DEBUG if debug else logging.INFO
 
+    if _logging_configured:
+        logging.getHandlerByName("console").setLevel(log_level)
+        logging.getLogger().setLevel(log_level)
+        logging.getLogger("src").setLevel(log_level)
+        return
+
     logging_config: Dict[str, Any] = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -35,58 +52,81 @@ def setup_logging(debug: bool = False) -> None:
                 "formatter": "standard",
                 "stream": "ext://sys.stdout",
             },
+            "queue": {
+                "class": "logging.handlers.QueueHandler",
+                "handlers": ["console"],
+                "respect_handler_level": True,
+            },
         },
         "loggers": {
             "": {  # root logger
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": log_level,
                 "propagate": True,
             },
-            "src": {"handlers": ["console"], "level": log_level, "propagate": False},
+            "src": {"handlers": ["queue"], "level": log_level, "propagate": False},
             # Suppress verbose HTTP client logs
             "httpcore": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
-            "httpx": {"handlers": ["console"], "level": "WARNING", "propagate": False},
+            "httpx": {"handlers": ["queue"], "level": "WARNING", "propagate": False},
             "urllib3": {
-                "handlers": ["console"],
+                "handlers": ["queue"],
                 "level": "WARNING",
                 "propagate": False,
             },
             # Keep OpenAI client logs at INFO level to see request summaries without verbose details
-            "openai": {"handlers": ["console"], "level": "INFO", "propagate": False},
+            "openai": {"handlers": ["queue"], "level": "INFO", "propagate": False},
         },
     }
 
     logging.config.dictConfig(logging_config)
 
+    listener = logging.getHandlerByName("queue").listener
+    listener.start()
+    atexit.register(listener.stop)
+    _logging_configured = True
+
 
 # Initialize Flask app
 app = Flask(__name__, static_folder="static", template_folder="templates")
+app.json = ORJSONProvider(app)
 CORS(app)
 init_socketio(app)
 
-# Register blueprints
-app.register_blueprint(main_bp)
-app.register_blueprint(langchain_bp)
-app.register_blueprint(mcp_server_bp)
-app.register_blueprint(text_processor_bp)
-app.register_blueprint(audio_processor_bp)
+
+def register_blueprints(enabled: str) -> None:
+    """
+    Register the main blueprint and the enabled experiment blueprints.
+
+    Experiment route modules are only imported here, so a deployment pays the
+    import cost of the experiments it serves and nothing else.
+
+    Args:
+        enabled: Comma-separated experiment names, e.g. "text_processor,langchain"
+    """
+    if routes.main_bp.name not in app.blueprints:
+        app.register_blueprint(routes.main_bp)
+
+    for name in filter(None, (part.strip() for part in enabled.split(","))):
+        blueprint = getattr(routes, f"{name}_bp")
+        if blueprint.name not in app.blueprints:
+            app.register_blueprint(blueprint)
 
 
 def create_app(debug: bool = False) -> Flask:
     """Factory function for creating the Flask application."""
     setup_logging(debug)
+    register_blueprints(settings.ENABLED_BLUEPRINTS)
     app.debug = debug
     return app
 
 
 def run_server(host: str = "0.0.0.0", port: int = 5000, debug: bool = False) -> None:
     """Run the server with Socket.IO support instead of standard Flask server."""
-    setup_logging(debug)
-    app.debug = debug
+    create_app(debug)
 
     logger = logging.getLogger(__name__)
     logger.info(f"Starting server on {host}:{port} with debug={debug}")
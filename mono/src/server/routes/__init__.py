@@ -3,9 +3,18 @@ Routes Package
 
 This package contains all route definitions for the application,
 organized into separate modules by feature/experiment.
+
+Experiment blueprints are resolved lazily from ``experiments``.
 """
 
-from .experiments import langchain_bp, mcp_server_bp, text_processor_bp
+from typing import Any
+
+from . import experiments
 from .main_routes import main_bp
 
-__all__ = ["main_bp", "langchain_bp", "mcp_server_bp", "text_processor_bp"]
+__all__ = ["main_bp", *experiments.__all__]
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve experiment blueprints on first access."""
+    return getattr(experiments, name)
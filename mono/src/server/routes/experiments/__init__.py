@@ -2,10 +2,30 @@
 Experiments Routes Package
 
 This package contains route modules for individual experiments.
+
+Blueprints are imported lazily (PEP 562), so importing the package does not pull
+in the dependencies of experiments the server does not serve.
 """
 
-from .langchain import langchain_bp
-from .mcp_server import mcp_server_bp
-from .text_processor import text_processor_bp
+from importlib import import_module
+from typing import Any
+
+# Blueprint name -> module defining it
+_BLUEPRINT_MODULES = {
+    "audio_processor_bp": ".audio_processor",
+    "langchain_bp": ".langchain",
+    "mcp_server_bp": ".mcp_server",
+    "text_processor_bp": ".text_processor",
+}
+
+__all__ = list(_BLUEPRINT_MODULES)
+
 
-__all__ = ["langchain_bp", "mcp_server_bp", "text_processor_bp"]
+def __getattr__(name: str) -> Any:
+    """Import an experiment's blueprint on first access."""
+    module_name = _BLUEPRINT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    blueprint = getattr(import_module(module_name, __name__), name)
+    globals()[name] = blueprint
+    return blueprint
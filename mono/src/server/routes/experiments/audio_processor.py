@@ -6,19 +6,51 @@ This module will contain routes for audio processing functionality.
 
 from typing import Any, Dict, Tuple
 
-from flask import Blueprint, Response, jsonify, render_template, request
+import orjson
+from flask import Blueprint, Response, request
+
+from src.server.utils.cached_page import CachedPage
 
 # Create a Blueprint for Audio Processor routes with a URL prefix
 audio_processor_bp = Blueprint(
     "audio_processor", __name__, url_prefix="/experiments/audio-processor"
 )
 
+# TODO: Create template for audio processor or integrate with text processor
+_index_page = CachedPage("experiments/text_processor/index.html")
+
+
+def _json_body(payload: Dict[str, Any]) -> bytes:
+    """Serialize a fixed response payload once, at import."""
+    return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+
+
+# The responses below never change, so they are serialized once
+_NO_AUDIO = _json_body({"success": False, "error": "No audio file provided"})
+_TRANSCRIBE_PLACEHOLDER = _json_body(
+    {
+        "success": True,
+        "result": {
+            "transcribed_text": "This is a placeholder for transcribed text. Implement actual transcription service.",
+            "confidence": 0.0,
+        },
+    }
+)
+_PROCESS_AUDIO_PLACEHOLDER = _json_body(
+    {
+        "success": True,
+        "result": {
+            "processed_result": "This is a placeholder for processed audio results. Implement actual multimodal AI processing.",
+            "processing_time_ms": 0,
+        },
+    }
+)
+
 
 @audio_processor_bp.route("/", methods=["GET"])
-def index() -> str:
+def index() -> Response:
     """Serve the Audio Processor experiment page."""
-    # TODO: Create template for audio processor or integrate with text processor
-    return render_template("experiments/text_processor/index.html")
+    return _index_page.response()
 
 
 @audio_processor_bp.route("/api/transcribe", methods=["POST"])
@@ -30,7 +62,7 @@ def transcribe_audio() -> Tuple[Response, int]:
     """
     # Check if the request contains a file
     if "audio" not in request.files:
-        return jsonify({"success": False, "error": "No audio file provided"}), 400
+        return Response(_NO_AUDIO, mimetype="application/json"), 400
 
     audio_file = request.files["audio"]
 
@@ -42,18 +74,7 @@ def transcribe_audio() -> Tuple[Response, int]:
     # 4. Returning the text and metadata
 
     # For now, return a placeholder response
-    return (
-        jsonify(
-            {
-                "success": True,
-                "result": {
-                    "transcribed_text": "This is a placeholder for transcribed text. Implement actual transcription service.",
-                    "confidence": 0.0,
-                },
-            }
-        ),
-        200,
-    )
+    return Response(_TRANSCRIBE_PLACEHOLDER, mimetype="application/json"), 200
 
 
 @audio_processor_bp.route("/api/process-audio", methods=["POST"])
@@ -65,7 +86,7 @@ def process_audio() -> Tuple[Response, int]:
     """
     # Check if the request contains a file
     if "audio" not in request.files:
-        return jsonify({"success": False, "error": "No audio file provided"}), 400
+        return Response(_NO_AUDIO, mimetype="application/json"), 400
 
     audio_file = request.files["audio"]
 
@@ -77,15 +98,4 @@ def process_audio() -> Tuple[Response, int]:
     # 4. Returning the processed data
 
     # For now, return a placeholder response
-    return (
-        jsonify(
-            {
-                "success": True,
-                "result": {
-                    "processed_result": "This is a placeholder for processed audio results. Implement actual multimodal AI processing.",
-                    "processing_time_ms": 0,
-                },
-            }
-        ),
-        200,
-    )
+    return Response(_PROCESS_AUDIO_PLACEHOLDER, mimetype="application/json"), 200
@@ -6,7 +6,7 @@ This module defines all routes for the LangChain Decision Agent experiment.
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from flask import Blueprint, Response, jsonify, render_template, request
+from flask import Blueprint, Response, jsonify, request
 
 from src.modules.langchain_agent.api import (
     create_persistent_agent,
@@ -14,17 +14,20 @@ from src.modules.langchain_agent.api import (
     get_recent_chains,
     process_with_langchain,
 )
+from src.server.utils.cached_page import CachedPage
 
 # Create a Blueprint for LangChain routes with a URL prefix
 langchain_bp = Blueprint(
     "langchain", __name__, url_prefix="/experiments/langchain-decision-agent"
 )
 
+_index_page = CachedPage("experiments/langchain/index.html")
+
 
 @langchain_bp.route("/", methods=["GET"])
-def index() -> str:
+def index() -> Response:
     """Serve the LangChain Decision Agent experiment page."""
-    return render_template("experiments/langchain/index.html")
+    return _index_page.response()
 
 
 @langchain_bp.route("/api/process", methods=["POST"])
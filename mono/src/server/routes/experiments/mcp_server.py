@@ -5,9 +5,12 @@ This module defines all routes for the MCP Server experiment.
 """
 
 import logging
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
-from flask import Blueprint, Response, jsonify, render_template
+import orjson
+from flask import Blueprint, Response, jsonify, request
 from flask_socketio import emit
 
 from src.mcp_server.client import MCPClient
@@ -15,9 +18,11 @@ from src.mcp_server.config import (
     AVAILABLE_TOOLS,
     DEBOUNCE_DELAY_MS,
     MAX_TEXT_LENGTH,
+    MCP_TOOLS_CACHE_TTL_SECONDS,
     SOCKET_EVENTS,
 )
 from src.server.socketio_instance import socketio
+from src.server.utils.cached_page import CachedPage
 from src.server.utils.decorators import (
     emit_on_error,
     handle_mcp_errors,
@@ -30,26 +35,54 @@ logger = logging.getLogger(__name__)
 # Create a Blueprint for MCP Server routes with a URL prefix
 mcp_server_bp = Blueprint("mcp_server", __name__, url_prefix="/experiments/mcp-server")
 
+_index_page = CachedPage(
+    "experiments/mcp_server/index.html",
+    config={
+        "debounce_delay_ms": DEBOUNCE_DELAY_MS,
+        "max_text_length": MAX_TEXT_LENGTH,
+        "available_tools": AVAILABLE_TOOLS,
+    },
+)
+
 
 @mcp_server_bp.route("/", methods=["GET"])
-def index() -> str:
+def index() -> Response:
     """Serve the MCP Server experiment page."""
-    return render_template(
-        "experiments/mcp_server/index.html",
-        config={
-            "debounce_delay_ms": DEBOUNCE_DELAY_MS,
-            "max_text_length": MAX_TEXT_LENGTH,
-            "available_tools": AVAILABLE_TOOLS,
-        },
-    )
+    return _index_page.response()
+
+
+# (fetched_at, tools, tools route body) from the last successful
+# MCPClient.get_tools() call
+_tools_cache: Optional[Tuple[float, List[Dict[str, Any]], bytes]] = None
+_tools_lock = threading.Lock()
+
+
+def _get_tools_cached() -> Tuple[List[Dict[str, Any]], bytes]:
+    """
+    Get the MCP tool list, refreshing it at most every cache TTL.
+
+    Listing tools starts an MCP server process, and the list rarely changes.
+    Concurrent callers wait on one refresh instead of each starting a server.
+
+    Returns:
+        The tools and the serialized success body of the tools route
+    """
+    global _tools_cache
+    with _tools_lock:
+        now = time.monotonic()
+        if _tools_cache is None or now - _tools_cache[0] > MCP_TOOLS_CACHE_TTL_SECONDS:
+            tools = MCPClient.get_tools()
+            body = orjson.dumps({"success": True, "tools": tools})
+            _tools_cache = (now, tools, body)
+        return _tools_cache[1], _tools_cache[2]
 
 
 @mcp_server_bp.route("/api/tools", methods=["GET"])
 @handle_mcp_errors
-def get_tools() -> Dict[str, Any]:
+def get_tools() -> bytes:
     """Get list of available MCP tools."""
-    tools = MCPClient.get_tools()
-    return {"tools": tools}
+    _, body = _get_tools_cached()
+    return body
 
 
 @mcp_server_bp.route("/api/call-tool", methods=["POST"])
@@ -57,8 +90,6 @@ def get_tools() -> Dict[str, Any]:
 @validate_json_data(["tool_name"])
 def call_tool() -> Dict[str, Any]:
     """Call an MCP tool."""
-    from flask import request
-
     tool_name = request.json["tool_name"]
     arguments = request.json.get("arguments", {})
 
@@ -96,5 +127,5 @@ def handle_mcp_call_tool_socket(data: Dict[str, Any]) -> Dict[str, Any]:
 @emit_on_error(SOCKET_EVENTS["mcp_tools_list"])
 def handle_mcp_get_tools_socket() -> Dict[str, Any]:
     """Get MCP tools via Socket.IO."""
-    tools = MCPClient.get_tools()
+    tools, _ = _get_tools_cached()
     return {"tools": tools}
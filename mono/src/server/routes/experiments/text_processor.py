@@ -5,9 +5,9 @@ This module defines all routes for the Text Processor experiment.
 """
 
 import logging
-from typing import Any, Dict, Tuple, Union, cast
+from typing import Any, Dict, Union, cast
 
-from flask import Blueprint, Response, jsonify, render_template, request
+from flask import Blueprint, Response, request
 from flask_socketio import emit
 from pydantic import ValidationError
 
@@ -20,6 +20,7 @@ from src.modules.text_processor.processor import process_text
 
 # Import the SocketIO instance and text processor
 from src.server.socketio_instance import socketio
+from src.server.utils.cached_page import CachedPage
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
@@ -36,34 +37,39 @@ EXPERIMENT_CONFIG: Dict[str, Any] = {
     "max_text_length": 5000,
 }
 
+_INVALID_REQUEST = b'{"error":"Invalid request"}'
+
+_index_page = CachedPage(
+    "experiments/text_processor/index.html", config=EXPERIMENT_CONFIG
+)
+_audio_page = CachedPage(
+    "experiments/text_processor/audio.html", config=EXPERIMENT_CONFIG
+)
+
 
 @text_processor_bp.route("/", methods=["GET"])
-def index() -> str:
+def index() -> Response:
     """Serve the Text Processor experiment page."""
-    return render_template(
-        "experiments/text_processor/index.html", config=EXPERIMENT_CONFIG
-    )
+    return _index_page.response()
 
 
 @text_processor_bp.route("/audio", methods=["GET"])
-def audio() -> str:
+def audio() -> Response:
     """Serve the Audio Processor page."""
-    return render_template(
-        "experiments/text_processor/audio.html", config=EXPERIMENT_CONFIG
-    )
+    return _audio_page.response()
 
 
 @text_processor_bp.route("/api/process", methods=["POST"])
-def handle_process_text() -> Tuple[Response, int]:
+def handle_process_text() -> Response:
     """Process text for the Text Processor experiment."""
     data = request.json
 
     if not data:
-        return jsonify({"error": "Invalid request"}), 400
+        return Response(_INVALID_REQUEST, status=400, mimetype="application/json")
 
     try:
-        # Convert to request model
-        req = TextProcessRequest(**data)
+        # Validate the request payload
+        req = TextProcessRequest.model_validate(data)
 
         # Process text
         response_text = process_text(req.text, req.session_id)
@@ -72,12 +78,19 @@ def handle_process_text() -> Tuple[Response, int]:
         result = ProcessingResult(response=response_text, session_id=req.session_id)
         response = TextProcessResponse.from_result(result)
 
-        # Return response
-        return jsonify(response.dict()), 200
+        # Serialize straight from the model, skipping the intermediate dict
+        return _model_response(response, 200)
     except ValidationError as e:
-        return jsonify(TextProcessResponse.from_error(str(e)).dict()), 400
+        return _model_response(TextProcessResponse.from_error(str(e)), 400)
     except Exception as e:
-        return jsonify(TextProcessResponse.from_error(str(e)).dict()), 500
+        return _model_response(TextProcessResponse.from_error(str(e)), 500)
+
+
+def _model_response(response: TextProcessResponse, status: int) -> Response:
+    """Build a JSON response serialized by pydantic-core."""
+    return Response(
+        response.model_dump_json(), status=status, mimetype="application/json"
+    )
 
 
 # Socket.IO event handlers
@@ -98,7 +111,7 @@ def handle_disconnect() -> None:
 def on_join(data: Dict[str, Any]) -> None:
     """Handle client joining a namespace."""
     namespace = data.get("namespace", "")
-    logger.info(f"Client joining namespace: {namespace}")
+    logger.info("Client joining namespace: %s", namespace)
     emit("message", {"data": f"Joined {namespace}"})
 
 
@@ -111,22 +124,17 @@ def handle_process_text_socket(data: Dict[str, Any]) -> None:
 
     text = data["text"]
     session_id = request.sid
-    logger.info(f"Processing text for session: {session_id}")
+    logger.info("Processing text for session: %s", session_id)
 
     try:
-        emit("processing_start", {"status": "started"})
-
         # Process text with session tracking
         response_text = process_text(text, session_id)
 
-        # Send the complete response in one chunk instead of line by line
-        emit("processing_update", {"chunk": response_text})
-
-        # Signal processing complete
-        emit("processing_complete", {"status": "complete"})
+        # The response is complete, so send it and the completion in one event
+        emit("processing_done", {"status": "complete", "chunk": response_text})
 
     except Exception as e:
-        logger.error(f"Error processing text: {str(e)}", exc_info=True)
+        logger.error("Error processing text: %s", e, exc_info=True)
         emit("error", {"message": str(e)})
 
 
@@ -138,20 +146,15 @@ def handle_process_audio(data: Dict[str, Any]) -> None:
         return
 
     try:
-        emit("processing_start", {"status": "started"})
-
         # Demo transcription (would be replaced with actual API call)
-        demo_text = "42"  # Use a number for our calculator
+        demo_text = "42"  # Stand-in for a transcription result
 
         # Process text with session tracking
         response_text = process_text(demo_text, request.sid)
 
-        # Send the complete response in one chunk
-        emit("processing_update", {"chunk": response_text})
-
-        # Signal processing complete
-        emit("processing_complete", {"status": "complete"})
+        # The response is complete, so send it and the completion in one event
+        emit("processing_done", {"status": "complete", "chunk": response_text})
 
     except Exception as e:
-        logger.error(f"Error processing audio: {str(e)}", exc_info=True)
+        logger.error("Error processing audio: %s", e, exc_info=True)
         emit("error", {"message": f"Error processing audio: {str(e)}"})
@@ -4,13 +4,17 @@ Main Routes
 This module defines the main routes for the application's landing page.
 """
 
-from flask import Blueprint, render_template
+from flask import Blueprint, Response
+
+from src.server.utils.cached_page import CachedPage
 
 # Create a Blueprint for main routes
 main_bp = Blueprint("main", __name__)
 
+_index_page = CachedPage("index.html")
+
 
 @main_bp.route("/", methods=["GET"])
-def index() -> str:
+def index() -> Response:
     """Serve the main HTML page."""
-    return render_template("index.html")
+    return _index_page.response()
@@ -49,16 +49,8 @@ const WebSocketResult = ({ inputText, audioBlob }) => {
       setConnected(false);
     });
 
-    socket.on('processing_start', () => {
-      setProcessing(true);
-      setResponse('');
-    });
-
-    socket.on('processing_update', (data) => {
-      setResponse(prev => prev + data.chunk);
-    });
-
-    socket.on('processing_complete', () => {
+    socket.on('processing_done', (data) => {
+      setResponse(data.chunk);
       setProcessing(false);
       processingRef.current = false;
       
@@ -86,6 +78,8 @@ const WebSocketResult = ({ inputText, audioBlob }) => {
     
     processingRef.current = true;
     latestInputRef.current = inputText;
+    setProcessing(true);
+    setResponse('');
     
     // Send to server for processing
     socketRef.current.emit('process_text', { text: inputText });
@@ -114,6 +108,8 @@ const WebSocketResult = ({ inputText, audioBlob }) => {
     const processAudio = async () => {
       try {
         processingRef.current = true;
+        setProcessing(true);
+        setResponse('');
         
         const reader = new FileReader();
         reader.readAsDataURL(audioBlob);
@@ -0,0 +1,52 @@
+"""
+Cached Template Pages
+
+This module provides a helper for serving page shells whose templates are rendered
+with a fixed context, so they only need to be rendered once per process.
+"""
+
+import hashlib
+from typing import Any, Optional, Tuple
+
+from flask import Response, current_app, render_template, request
+
+
+class CachedPage:
+    """
+    A template rendered once and served from memory with a strong ETag.
+
+    Rendering is deferred to the first request, which runs inside an application
+    context. In debug mode the template is rendered on every request so edits show
+    up without a restart.
+
+    Usage:
+        _index_page = CachedPage("index.html")
+
+        @bp.route("/")
+        def index():
+            return _index_page.response()
+    """
+
+    def __init__(self, template_name: str, **context: Any):
+        self.template_name = template_name
+        self.context = context
+        self._rendered: Optional[Tuple[bytes, str]] = None
+
+    def _render(self) -> Tuple[bytes, str]:
+        body = render_template(self.template_name, **self.context).encode()
+        return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    def response(self) -> Response:
+        """Build the page response, answering 304 when the client's copy is current."""
+        if current_app.debug:
+            body, etag = self._render()
+        else:
+            if self._rendered is None:
+                self._rendered = self._render()
+            body, etag = self._rendered
+
+        response = Response(body, mimetype="text/html")
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = 60
+        return response.make_conditional(request)
@@ -7,9 +7,9 @@ Flask routes and Socket.IO handlers.
 
 import logging
 from functools import wraps
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Tuple, Union
 
-from flask import Response, jsonify
+from flask import Response, jsonify, request
 from flask_socketio import emit
 
 logger = logging.getLogger(__name__)
@@ -27,19 +27,25 @@ def handle_mcp_errors(func: Callable) -> Callable:
         def my_route():
             # Route logic that might fail
             return {"success": True, "data": result}
+
+    A route may also return an already serialized JSON body as bytes, which is
+    sent as-is.
     """
 
     @wraps(func)
-    def wrapper(*args, **kwargs) -> Tuple[Response, int]:
+    def wrapper(*args, **kwargs) -> Union[Response, Tuple[Response, int]]:
         try:
             result = func(*args, **kwargs)
             # If function returns a tuple (response, status_code), return as-is
             if isinstance(result, tuple):
                 return result
+            # If function returns a serialized body, skip the merge and re-encode
+            if isinstance(result, (bytes, bytearray)):
+                return Response(result, status=200, mimetype="application/json")
             # If function returns just data, wrap in success response
             return jsonify({"success": True, **result}), 200
         except Exception as e:
-            logger.error(f"Error in {func.__name__}: {str(e)}", exc_info=True)
+            logger.error("Error in %s: %s", func.__name__, e, exc_info=True)
             return (
                 jsonify(
                     {
@@ -81,7 +87,9 @@ def emit_on_error(success_event: str, error_event: str = "mcp_error") -> Callabl
                     emit(success_event, {"success": True})
             except Exception as e:
                 logger.error(
-                    f"Error in Socket.IO handler {func.__name__}: {str(e)}",
+                    "Error in Socket.IO handler %s: %s",
+                    func.__name__,
+                    e,
                     exc_info=True,
                 )
                 emit(error_event, {"message": str(e), "handler": func.__name__})
@@ -104,18 +112,19 @@ def validate_json_data(required_fields: list = None) -> Callable:
             # request.json is guaranteed to have required fields
     """
 
+    # Fixed once per decorated route rather than per request
+    required = tuple(required_fields or ())
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs):
-            from flask import request
-
-            if not request.json:
+            # Parsed once and cached on the request for the route to reuse
+            payload = request.get_json(silent=True)
+            if not payload:
                 return jsonify({"success": False, "error": "JSON data required"}), 400
 
-            if required_fields:
-                missing_fields = [
-                    field for field in required_fields if field not in request.json
-                ]
+            if required:
+                missing_fields = [field for field in required if field not in payload]
                 if missing_fields:
                     return (
                         jsonify(
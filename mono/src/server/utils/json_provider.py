@@ -0,0 +1,29 @@
+"""
+orjson JSON Provider
+
+This module provides a Flask JSON provider that serializes with orjson, so
+``jsonify`` responses are encoded in C instead of by the stdlib ``json`` module.
+"""
+
+from typing import Any
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """
+        Serialize data as JSON.
+
+        Honors the ``sort_keys`` and ``indent`` settings of the default provider;
+        types orjson does not support natively fall back to its ``default``.
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
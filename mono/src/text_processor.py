@@ -10,7 +10,7 @@ from typing import Tuple
 from pydantic import BaseModel, Field
 
 from src.modules.llms import AIClientError
-from src.modules.llms.ai_client import default_client
+from src.modules.llms.ai_client import get_default_client
 from src.modules.planner.plan_creator import ProcessingPlan, create_plan
 
 
@@ -37,7 +37,7 @@ def get_ai_response(text: str) -> str:
     """
     prompt = f"Please provide a brief analysis of the following text: {text}"
     try:
-        return default_client.generate_response(prompt)
+        return get_default_client().generate_response(prompt)
     except AIClientError as e:
         raise AIClientError(f"Failed to get AI response: {str(e)}") from e
 
@@ -30,6 +30,57 @@ class Settings(BaseSettings):
     TEMPERATURE: float = Field(
         0.7, description="Temperature for OpenAI response generation"
     )
+    OPENAI_SERVICE_TIER: Optional[str] = Field(
+        None,
+        description="OpenAI service tier, e.g. 'priority' for lower latency",
+    )
+
+    # --- LLM response caching ---
+    SEMANTIC_CACHE_ENABLED: bool = Field(
+        False, description="Serve near-duplicate prompts from a semantic cache"
+    )
+    SEMANTIC_CACHE_THRESHOLD: float = Field(
+        0.92, description="Minimum cosine similarity for a semantic cache hit"
+    )
+    SEMANTIC_CACHE_MAX_ENTRIES: int = Field(
+        256, description="Maximum number of entries kept in the semantic cache"
+    )
+    SEMANTIC_CACHE_TTL_SECONDS: float = Field(
+        3600, description="Seconds before a semantic cache entry expires"
+    )
+    EMBEDDING_MODEL: str = Field(
+        "text-embedding-3-small", description="OpenAI model used for prompt embeddings"
+    )
+
+    # --- LLM concurrency (async calls, per provider) ---
+    LLM_MAX_CONCURRENCY: int = Field(
+        8, description="Maximum concurrent async OpenAI requests"
+    )
+    GEMINI_MAX_CONCURRENCY: int = Field(
+        4, description="Maximum concurrent async Gemini requests"
+    )
+    DEEPSEEK_MAX_CONCURRENCY: int = Field(
+        4, description="Maximum concurrent async Deepseek requests"
+    )
+
+    # --- Text processor ---
+    SESSION_CACHE_MAX: int = Field(
+        10_000, description="Maximum number of text processor sessions kept in memory"
+    )
+    SESSION_TTL_SECONDS: float = Field(
+        3600,
+        description="Seconds of inactivity before a text processor session expires",
+    )
+    SESSION_SAVE_IN_BACKGROUND: bool = Field(
+        True,
+        description="Save text processor sessions off the response path, in order",
+    )
+
+    # --- Server ---
+    ENABLED_BLUEPRINTS: str = Field(
+        "text_processor,langchain,mcp_server,audio_processor",
+        description="Comma-separated experiments whose routes the server registers",
+    )
 
     # --- Google Gemini ---
     GEMINI_API_KEY: Optional[str] = Field(
@@ -1,6 +1,8 @@
 """
 Test configuration and fixtures for pytest.
 """
+import copy
+import sqlite3
 from typing import Any, Dict, List, Optional
 
 import pytest
@@ -8,8 +10,10 @@ from langchain_core.language_models import BaseLanguageModel
 from langchain_core.messages import AIMessage
 from langchain_core.outputs import Generation, LLMResult
 from langchain_core.runnables import Runnable
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from src.modules.langchain_agent import Base
 from src.modules.langchain_agent.models.domain import DecisionChain, DecisionStep
@@ -18,6 +22,25 @@ from src.modules.langchain_agent.repositories.sqlite_repository import (
 )
 from src.modules.langchain_agent.services.agent_service import LangChainAgentService
 
+# Test databases are throwaway, so skip fsync and keep journals in memory
+_TEST_SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=OFF",
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+
+@event.listens_for(Engine, "connect")
+def _apply_test_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply the test PRAGMAs to every SQLite connection opened during tests."""
+    if not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for pragma in _TEST_SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class MockLLM(Runnable):
     """Simple mock LLM for testing purposes."""
@@ -51,6 +74,82 @@ class MockLLM(Runnable):
         return {"name": "MockLLM"}
 
 
+class FakeDecisionChainRepository:
+    """In-memory decision chain repository that records the chains it saves."""
+
+    def __init__(self, chain_id: str = "test-chain-id"):
+        """Initialize with the ID returned for every saved chain."""
+        self.chain_id = chain_id
+        self.saved: List[DecisionChain] = []
+
+    def save_chain(self, chain: DecisionChain) -> str:
+        """Record the chain and return the configured ID."""
+        self.saved.append(chain)
+        return self.chain_id
+
+    def get_chain(self, chain_id: str) -> Optional[DecisionChain]:
+        """Return the saved chain with the given ID, if any."""
+        return next((c for c in self.saved if c.chain_id == chain_id), None)
+
+    def get_recent_chains(self, limit: int = 10) -> List[DecisionChain]:
+        """Return the most recently saved chains first."""
+        return self.saved[::-1][:limit]
+
+
+class FakeAgentService:
+    """Agent service stand-in that returns a canned chain and records calls."""
+
+    def __init__(
+        self, chain: Optional[DecisionChain] = None, chain_id: Optional[str] = None
+    ):
+        """Initialize with the chain and ID to hand back."""
+        self.chain = chain
+        self.chain_id = chain_id
+        self.calls: List[tuple] = []
+
+    def get_chain(self, chain_id: str) -> Optional[DecisionChain]:
+        """Record the lookup and return the canned chain."""
+        self.calls.append(("get_chain", chain_id))
+        return self.chain
+
+    def process_text_with_persistence(self, text: str) -> tuple:
+        """Record the request and return the canned chain and ID."""
+        self.calls.append(("process_text_with_persistence", text))
+        return self.chain, self.chain_id
+
+
+class CallSpy:
+    """Callable that records the arguments of each call and returns a fixed value."""
+
+    def __init__(self, return_value: Any = None):
+        """Initialize with the value every call returns."""
+        self.return_value = return_value
+        self.calls: List[tuple] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and return the configured value."""
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+@pytest.fixture
+def fake_repository():
+    """Fixture providing a fake decision chain repository."""
+    return FakeDecisionChainRepository()
+
+
+@pytest.fixture
+def fake_agent_service():
+    """Fixture providing a fake agent service."""
+    return FakeAgentService()
+
+
+@pytest.fixture
+def spy():
+    """Fixture providing the factory for call-recording callables."""
+    return CallSpy
+
+
 @pytest.fixture
 def mock_llm():
     """Fixture providing a mock LLM."""
@@ -63,19 +162,52 @@ def mock_llm():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def in_memory_db():
-    """Fixture providing an in-memory SQLite database."""
-    engine = create_engine("sqlite:///:memory:")
+    """Fixture providing one in-memory SQLite database for the whole test run."""
+    # StaticPool keeps the single connection that holds the in-memory database
+    engine = create_engine(
+        "sqlite://",
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+    )
+
+    # Let SQLAlchemy emit BEGIN itself so pysqlite supports savepoints
+    @event.listens_for(engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin(connection):
+        connection.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_connection(in_memory_db):
+    """Fixture providing a connection whose changes are rolled back after the test."""
+    connection = in_memory_db.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
 
 
 @pytest.fixture
-def db_session(in_memory_db):
+def db_session_factory(db_connection):
+    """Fixture providing sessions that commit to savepoints in the test transaction."""
+    return sessionmaker(bind=db_connection, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+def db_session(db_session_factory):
     """Fixture providing a database session with in-memory database."""
-    Session = sessionmaker(bind=in_memory_db)
-    session = Session()
+    session = db_session_factory()
     try:
         yield session
     finally:
@@ -83,10 +215,9 @@ def db_session(in_memory_db):
 
 
 @pytest.fixture
-def repository():
+def repository(db_session_factory):
     """Fixture providing a repository with in-memory database."""
-    # Using None as db_path will use the in-memory database for testing
-    return SQLiteDecisionChainRepository(db_path=None)
+    return SQLiteDecisionChainRepository(session_factory=db_session_factory)
 
 
 @pytest.fixture
@@ -102,9 +233,13 @@ def sample_decision_step():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_decision_chain():
-    """Fixture providing a sample decision chain."""
+    """Fixture providing a sample decision chain shared by the whole run.
+
+    Tests must treat it as read-only; use ``mutable_sample_decision_chain`` to
+    modify a chain.
+    """
     step1 = DecisionStep(
         step_id="step-1",
         step_number=1,
@@ -132,26 +267,37 @@ def sample_decision_chain():
 
 
 @pytest.fixture
-def agent_with_mock_llm(mock_llm, repository):
-    """Fixture providing a LangChainAgent with a mock LLM."""
-    # Create a minimal agent with mocked components
-    agent = LangChainAgentService(repository=repository, llm=mock_llm, verbose=False)
+def mutable_sample_decision_chain(sample_decision_chain):
+    """Fixture providing a private copy of the sample chain that may be modified."""
+    return copy.deepcopy(sample_decision_chain)
+
+
+class MockSimpleLLMExecutor:
+    """Agent executor stand-in that answers every step from the mock LLM."""
+
+    def __init__(self, llm):
+        self.llm = llm
 
-    # Create a simple mock executor that directly uses the mock LLM
-    class MockSimpleLLMExecutor:
-        def __init__(self, llm):
-            self.llm = llm
+    def invoke(self, input_data):
+        # Get the response from the mock LLM
+        response = self.llm.invoke(input_data.get("input", ""))
 
-        def invoke(self, input_data):
-            # Get the response from the mock LLM
-            response = self.llm.invoke(input_data.get("input", ""))
+        # Handle case where response is an AIMessage or other message type
+        if hasattr(response, "content"):
+            response = response.content
 
-            # Handle case where response is an AIMessage or other message type
-            if hasattr(response, "content"):
-                response = response.content
+        # Return the output in the expected format
+        return {"output": response}
 
-            # Return the output in the expected format
-            return {"output": response}
+    async def ainvoke(self, input_data):
+        return self.invoke(input_data)
+
+
+@pytest.fixture
+def agent_with_mock_llm(mock_llm, repository):
+    """Fixture providing a LangChainAgent with a mock LLM."""
+    # The agent is cheap to build around MockLLM, so each test gets a fresh one
+    agent = LangChainAgentService(repository=repository, llm=mock_llm, verbose=False)
 
     # Replace the agent's executor with our mock
     agent.agent = MockSimpleLLMExecutor(mock_llm)
@@ -171,6 +171,19 @@ def test_step_model_to_pydantic(db_session, sample_decision_step):
     assert pydantic_step.metadata == sample_decision_step.metadata
 
 
+def test_step_model_to_pydantic_decodes_lazily(sample_decision_step):
+    """Test that JSON columns are only decoded when accessed."""
+    step_model = StepModel.from_pydantic(sample_decision_step, "test-chain-id")
+
+    step = step_model.to_pydantic()
+
+    assert step._next_actions is None
+    assert step._metadata is None
+    assert step.next_actions == sample_decision_step.next_actions
+    assert step.metadata == sample_decision_step.metadata
+    assert step == sample_decision_step
+
+
 def test_step_model_from_pydantic(sample_decision_step):
     """Test creating a StepModel from a Pydantic model."""
     # Convert to SQLAlchemy model
@@ -1,38 +1,24 @@
 """
 Tests for the LangChainAgentService.
 """
-from unittest.mock import MagicMock, patch
-
 import pytest
+from langchain_community.chat_message_histories import ChatMessageHistory
 
 from src.modules.langchain_agent.models.domain import DecisionChain
 from src.modules.langchain_agent.services.agent_service import LangChainAgentService
 
 
-@pytest.fixture
-def mock_repository():
-    """Fixture providing a mock repository."""
-    repo = MagicMock()
-    return repo
-
-
-@pytest.fixture
-def mock_llm():
-    """Fixture providing a mock language model."""
-    llm = MagicMock()
-    llm.invoke.return_value = {"output": "Mock LLM response"}
-    return llm
-
-
 class TestLangChainAgentService:
     """Tests for the LangChainAgentService class."""
 
-    def test_process_text_with_persistence(self, mock_repository, mock_llm):
+    def test_process_text_with_persistence(
+        self, fake_repository, mock_llm, monkeypatch
+    ):
         """Test processing text with persistence."""
         # Arrange
-        service = LangChainAgentService(repository=mock_repository, llm=mock_llm)
+        service = LangChainAgentService(repository=fake_repository, llm=mock_llm)
 
-        # Mock the process_text method
+        # Stub out the process_text method
         sample_chain = DecisionChain(
             title="Test Chain",
             context="Test context",
@@ -40,14 +26,32 @@ class TestLangChainAgentService:
             final_decision="Test decision",
             status="completed",
         )
-        mock_repository.save_chain.return_value = "test-chain-id"
+        monkeypatch.setattr(service, "process_text", lambda text: sample_chain)
+
+        # Act
+        chain, chain_id = service.process_text_with_persistence("Test input")
+
+        # Assert
+        assert chain == sample_chain
+        assert chain_id == "test-chain-id"
+        assert fake_repository.saved == [sample_chain]
+
+    @pytest.mark.parametrize(
+        "history_window, expected",
+        [(0, []), (2, ["question 1", "answer 1"])],
+    )
+    def test_step_input_sends_history_window(
+        self, fake_repository, mock_llm, history_window, expected
+    ):
+        """Test that each step sends at most history_window recent messages."""
+        service = LangChainAgentService(
+            repository=fake_repository, llm=mock_llm, history_window=history_window
+        )
+        history = ChatMessageHistory()
+        for i in range(2):
+            history.add_user_message(f"question {i}")
+            history.add_ai_message(f"answer {i}")
 
-        # Create a patch for the process_text method
-        with patch.object(service, "process_text", return_value=sample_chain):
-            # Act
-            chain, chain_id = service.process_text_with_persistence("Test input")
+        step_input = service._step_input(1, "Test input", history)
 
-            # Assert
-            assert chain == sample_chain
-            assert chain_id == "test-chain-id"
-            mock_repository.save_chain.assert_called_once_with(sample_chain)
+        assert [m.content for m in step_input["chat_history"]] == expected
@@ -1,6 +1,8 @@
 """
 Tests for the LangChain Agent implementation.
 """
+import asyncio
+
 import pytest
 
 from src.modules.langchain_agent.models.domain import DecisionChain, DecisionStep
@@ -64,6 +66,7 @@ def test_create_decision_chain(agent_with_mock_llm, monkeypatch):
     )
 
     agent = agent_with_mock_llm
+    agent.llm_titles = True
     chain = agent.create_decision_chain("Test context")
 
     assert chain.title == "Generated Title"
@@ -73,6 +76,33 @@ def test_create_decision_chain(agent_with_mock_llm, monkeypatch):
     assert agent.active_chain == chain
 
 
+def test_create_decision_chain_local_title(agent_with_mock_llm, monkeypatch):
+    """Test that titles are derived from the context without an LLM call."""
+
+    def fail(_):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr(
+        "src.modules.llms.ai_client.default_client.generate_response", fail
+    )
+
+    agent = agent_with_mock_llm
+    chain = agent.create_decision_chain(
+        "should we move the team to a four day week? It has pros and cons."
+    )
+
+    assert chain.title == "Should We Move The Team To A"
+
+
+def test_local_title_keeps_apostrophes_and_acronyms(agent_with_mock_llm):
+    """Test that local titles do not mangle contractions or acronyms."""
+    chain = agent_with_mock_llm.create_decision_chain(
+        "what's the best AI-driven option? More detail follows."
+    )
+
+    assert chain.title == "What's The Best AI-driven Option"
+
+
 def test_add_decision_step(agent_with_mock_llm):
     """Test adding a step to the decision chain."""
     agent = agent_with_mock_llm
@@ -121,6 +151,36 @@ def test_complete_decision_chain_no_active_chain(agent_with_mock_llm):
         agent.complete_decision_chain("Final decision")
 
 
+def test_step_input_limits_chat_history(agent_with_mock_llm):
+    """Test that only the most recent messages are sent with a step."""
+    agent = agent_with_mock_llm
+    agent.history_window = 2
+    for i in range(3):
+        agent.message_history.add_user_message(f"question {i}")
+        agent.message_history.add_ai_message(f"answer {i}")
+
+    step_input = agent._step_input(4, "Test input text", agent.message_history)
+
+    assert [m.content for m in step_input["chat_history"]] == [
+        "question 2",
+        "answer 2",
+    ]
+    assert len(agent.message_history.messages) == 6
+
+
+def test_record_step_splits_reasoning_and_decision(agent_with_mock_llm):
+    """Test that step output is split at the first blank line."""
+    agent = agent_with_mock_llm
+    chain = agent.create_decision_chain("Test context", title="Test Chain")
+
+    agent._record_step(chain, agent.message_history, 1, "Why\n\nWhat\n\nMore")
+    agent._record_step(chain, agent.message_history, 2, "No separator")
+
+    assert chain.steps[0].reasoning == "Why"
+    assert chain.steps[0].decision == "What\n\nMore"
+    assert chain.steps[1].reasoning == chain.steps[1].decision == "No separator"
+
+
 def test_process_text(agent_with_mock_llm, monkeypatch):
     """Test processing text through the decision chain."""
     # Mock the title generation
@@ -130,6 +190,7 @@ def test_process_text(agent_with_mock_llm, monkeypatch):
     )
 
     agent = agent_with_mock_llm
+    agent.llm_titles = True
     chain = agent.process_text("Test input text")
 
     assert chain.title == "Generated Title"
@@ -139,6 +200,52 @@ def test_process_text(agent_with_mock_llm, monkeypatch):
     assert chain.status == "completed"
 
 
+def test_aprocess_text(agent_with_mock_llm, monkeypatch):
+    """Test processing text through the async decision chain."""
+
+    async def fake_title(_):
+        return "Generated Title"
+
+    monkeypatch.setattr(
+        "src.modules.llms.ai_client.default_client.agenerate_response", fake_title
+    )
+
+    agent = agent_with_mock_llm
+    agent.llm_titles = True
+    chain = asyncio.run(agent.aprocess_text("Test input text"))
+
+    assert chain.title == "Generated Title"
+    assert chain.context == "Test input text"
+    assert len(chain.steps) == 5
+    assert chain.steps[0].reasoning == "Initial analysis of the text."
+    assert chain.final_decision.startswith("After 5 steps of analysis")
+    assert chain.status == "completed"
+
+
+def test_process_texts(agent_with_mock_llm, monkeypatch):
+    """Test processing several texts concurrently."""
+
+    async def fake_title(prompt):
+        return "Title"
+
+    monkeypatch.setattr(
+        "src.modules.llms.ai_client.default_client.agenerate_response", fake_title
+    )
+
+    agent = agent_with_mock_llm
+    agent.llm_titles = True
+    chains = asyncio.run(agent.process_texts(["First text", "Second text"]))
+
+    assert [chain.context for chain in chains] == ["First text", "Second text"]
+    assert chains[0].chain_id != chains[1].chain_id
+    for chain in chains:
+        assert chain.title == "Title"
+        assert len(chain.steps) == 5
+        assert [step.step_number for step in chain.steps] == [1, 2, 3, 4, 5]
+        assert chain.status == "completed"
+    assert agent.active_chain is None
+
+
 def test_create_agent():
     """Test the get_langchain_agent_service factory function."""
     agent = get_langchain_agent_service()
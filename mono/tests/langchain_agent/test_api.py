@@ -1,12 +1,13 @@
 """
 Tests for the LangChain Agent API.
 """
-from unittest.mock import patch
-
 import pytest
 
 from src.modules.langchain_agent.api import process_with_langchain
-from src.modules.langchain_agent.models.api import LangChainDecisionResult
+from src.modules.langchain_agent.models.api import (
+    LangChainDecisionResult,
+    ProcessTextResponse,
+)
 
 
 def test_langchain_decision_result():
@@ -34,31 +35,44 @@ def test_convert_to_result(sample_decision_chain):
     assert result.chain_id == sample_decision_chain.chain_id
 
 
-def test_convert_to_result_no_final_decision(sample_decision_chain):
+def test_convert_to_result_no_final_decision(mutable_sample_decision_chain):
     """Test converting a DecisionChain with no final decision."""
     # Create a chain with no final decision
-    sample_decision_chain.final_decision = None
+    mutable_sample_decision_chain.final_decision = None
 
-    result = LangChainDecisionResult.from_domain(sample_decision_chain)
+    result = LangChainDecisionResult.from_domain(mutable_sample_decision_chain)
 
     assert result.final_decision == "No final decision reached"
 
 
-@patch("src.modules.langchain_agent.api.get_langchain_agent_service")
+def test_process_text_response_from_chain(sample_decision_chain):
+    """Test building a ProcessTextResponse from a DecisionChain."""
+    response = ProcessTextResponse.from_chain(sample_decision_chain)
+
+    assert response.success is True
+    assert response.error is None
+    assert response.result.chain_id == sample_decision_chain.chain_id
+    assert response.result.step_count == len(sample_decision_chain.steps)
+    assert response.model_dump()["result"]["title"] == sample_decision_chain.title
+
+
 def test_process_with_langchain(
-    mock_get_service, agent_with_mock_llm, sample_decision_chain, monkeypatch
+    agent_with_mock_llm, sample_decision_chain, monkeypatch, spy
 ):
     """Test processing text with the LangChain agent through the API."""
-    # Set up the mock agent to return our sample chain
-    mock_agent = agent_with_mock_llm
-    monkeypatch.setattr(mock_agent, "process_text", lambda _: sample_decision_chain)
-    mock_get_service.return_value = mock_agent
+    # Set up the agent to return our sample chain
+    agent = agent_with_mock_llm
+    monkeypatch.setattr(agent, "process_text", lambda _: sample_decision_chain)
+    get_service = spy(agent)
+    monkeypatch.setattr(
+        "src.modules.langchain_agent.api.get_langchain_agent_service", get_service
+    )
 
     # Call the API function
     chain, result = process_with_langchain("Test input")
 
-    # Verify the mock was called
-    mock_get_service.assert_called_once()
+    # Verify the service was looked up once
+    assert get_service.calls == [((), {})]
 
     # Verify the results
     assert chain == sample_decision_chain
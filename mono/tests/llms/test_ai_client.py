@@ -0,0 +1,99 @@
+"""
+Tests for the AI client helpers.
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors as genai_errors
+from tenacity import wait_none
+
+from src.modules.llms import ai_client
+
+
+def test_call_with_limits_bounds_concurrency(monkeypatch):
+    """Test that async calls never exceed the provider's concurrency limit."""
+    monkeypatch.setitem(ai_client.PROVIDER_CONCURRENCY, "openai", 2)
+    in_flight = 0
+    peak = 0
+
+    async def fake_call():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return "ok"
+
+    async def run():
+        return await asyncio.gather(
+            *[ai_client._call_with_limits("openai", fake_call) for _ in range(6)]
+        )
+
+    assert asyncio.run(run()) == ["ok"] * 6
+    assert peak == 2
+
+
+def test_is_transient():
+    """Test detection of retryable provider errors."""
+    assert ai_client._is_transient(genai_errors.APIError(429, {}))
+    assert ai_client._is_transient(genai_errors.APIError(503, {}))
+    assert not ai_client._is_transient(genai_errors.APIError(400, {}))
+    assert not ai_client._is_transient(ValueError("boom"))
+
+
+def test_call_with_retries_retries_transient_errors(monkeypatch):
+    """Test that transient errors are retried and other errors are not."""
+    monkeypatch.setitem(ai_client._RETRY_POLICY, "wait", wait_none())
+    attempts = []
+
+    def flaky_call():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise genai_errors.APIError(503, {})
+        return "ok"
+
+    assert ai_client._call_with_retries(flaky_call) == "ok"
+    assert len(attempts) == 3
+
+    def broken_call():
+        attempts.append(1)
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        ai_client._call_with_retries(broken_call)
+    assert len(attempts) == 4
+
+
+def test_agenerate_response_stream_yields_deltas(monkeypatch):
+    """Test that streamed deltas are yielded in order and then cached."""
+    client = ai_client.AIClient()
+    client.temperature = 0
+
+    async def fake_stream():
+        for text in ["Hello", None, " world"]:
+            delta = SimpleNamespace(content=text)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+    async def fake_create(**kwargs):
+        assert kwargs["stream"] is True
+        return fake_stream()
+
+    monkeypatch.setattr(client.aclient.chat.completions, "create", fake_create)
+
+    async def collect():
+        return [delta async for delta in client.agenerate_response_stream("Hi")]
+
+    assert asyncio.run(collect()) == ["Hello", " world"]
+    assert asyncio.run(collect()) == ["Hello world"]
+
+
+def test_prepare_messages_shares_default_system_message():
+    """Test that the default system message is prepended without copying input."""
+    messages = [{"role": "user", "content": "Hi"}]
+
+    prepared = ai_client.AIClient._prepare_messages(None, messages)
+
+    assert prepared[0] is ai_client.DEFAULT_SYSTEM_MESSAGE
+    assert prepared[1:] == messages
+    assert messages == [{"role": "user", "content": "Hi"}]
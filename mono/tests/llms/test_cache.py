@@ -0,0 +1,163 @@
+"""
+Tests for the LLM response caches.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from src.modules.llms.cache import LLMCache, SemanticCache
+
+VECTORS = {
+    "a blue car": [1.0, 0.0, 0.0],
+    "a blue car please": [0.99, 0.1, 0.0],
+    "a red house": [0.0, 1.0, 0.0],
+}
+
+
+class TestLLMCache:
+    """Tests for the LLMCache class."""
+
+    def test_key_is_order_independent(self):
+        """Test that keyword order does not change the cache key."""
+        assert LLMCache.make_key(model="m", temperature=0) == LLMCache.make_key(
+            temperature=0, model="m"
+        )
+
+    def test_get_and_set(self):
+        """Test storing and retrieving an exact match."""
+        cache = LLMCache()
+        key = LLMCache.make_key(model="m", messages=[{"role": "user", "content": "hi"}])
+
+        assert cache.get(key) is None
+        cache.set(key, "hello")
+
+        assert cache.get(key) == "hello"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_entries_expire(self):
+        """Test that entries older than the TTL are dropped."""
+        cache = LLMCache(ttl_seconds=10)
+        with patch("src.modules.llms.cache.time.monotonic", return_value=0.0):
+            cache.set("key", "value")
+
+        with patch("src.modules.llms.cache.time.monotonic", return_value=11.0):
+            assert cache.get("key") is None
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """Test that the cache is bounded by maxsize."""
+        cache = LLMCache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_get_or_set_coalesces_concurrent_misses(self):
+        """Test that concurrent misses for one key share a single computation."""
+        cache = LLMCache()
+        release = threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "response"
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(cache.get_or_set, "key", compute) for _ in range(4)
+            ]
+            time.sleep(0.05)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["response"] * 4
+        assert len(calls) == 1
+        assert cache.get("key") == "response"
+
+
+@pytest.fixture
+def semantic_cache():
+    """Fixture providing a semantic cache with a fixed embedding table."""
+    return SemanticCache(embed=VECTORS.__getitem__, threshold=0.9, max_entries=2)
+
+
+class TestSemanticCache:
+    """Tests for the SemanticCache class."""
+
+    def test_similar_prompt_hits(self, semantic_cache):
+        """Test that a near-duplicate prompt returns the stored response."""
+        cached, embedding = semantic_cache.lookup("bucket", "a blue car")
+        assert cached is None
+        semantic_cache.store("bucket", embedding, "cached response")
+
+        cached, _ = semantic_cache.lookup("bucket", "a blue car please")
+
+        assert cached == "cached response"
+        assert semantic_cache.stats.hits == 1
+        assert semantic_cache.stats.misses == 1
+
+    def test_dissimilar_prompt_misses(self, semantic_cache):
+        """Test that an unrelated prompt is not served from the cache."""
+        _, embedding = semantic_cache.lookup("bucket", "a blue car")
+        semantic_cache.store("bucket", embedding, "cached response")
+
+        cached, _ = semantic_cache.lookup("bucket", "a red house")
+
+        assert cached is None
+
+    def test_buckets_are_isolated(self, semantic_cache):
+        """Test that entries are only matched within their bucket."""
+        _, embedding = semantic_cache.lookup("bucket-a", "a blue car")
+        semantic_cache.store("bucket-a", embedding, "cached response")
+
+        cached, _ = semantic_cache.lookup("bucket-b", "a blue car")
+
+        assert cached is None
+
+    def test_expired_entries_are_dropped(self, semantic_cache):
+        """Test that entries older than the TTL are not returned."""
+        semantic_cache.ttl_seconds = 10
+        with patch("src.modules.llms.cache.time.monotonic", return_value=0.0):
+            _, embedding = semantic_cache.lookup("bucket", "a blue car")
+            semantic_cache.store("bucket", embedding, "cached response")
+
+        with patch("src.modules.llms.cache.time.monotonic", return_value=11.0):
+            cached, _ = semantic_cache.lookup("bucket", "a blue car")
+
+        assert cached is None
+
+    def test_least_recently_used_entry_is_evicted(self, semantic_cache):
+        """Test that the bucket is bounded by max_entries."""
+        for text in ["a blue car", "a red house"]:
+            _, embedding = semantic_cache.lookup("bucket", text)
+            semantic_cache.store("bucket", embedding, text)
+        _, embedding = semantic_cache.lookup("bucket", "a blue car please")
+        semantic_cache.store("bucket", [0.0, 0.0, 1.0], "third")
+
+        cached, _ = semantic_cache.lookup("bucket", "a red house")
+
+        assert cached is None
+
+    def test_bucket_grows_past_initial_capacity(self):
+        """Test that entries beyond the preallocated rows are kept."""
+
+        def one_hot(text):
+            vector = [0.0] * 40
+            vector[int(text)] = 1.0
+            return vector
+
+        cache = SemanticCache(embed=one_hot, max_entries=64)
+        for i in range(40):
+            _, embedding = cache.lookup("bucket", str(i))
+            cache.store("bucket", embedding, f"response {i}")
+
+        assert cache.lookup("bucket", "0")[0] == "response 0"
+        assert cache.lookup("bucket", "39")[0] == "response 39"
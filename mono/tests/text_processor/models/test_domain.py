@@ -1,10 +1,13 @@
 """
 Tests for the Text Processor domain models.
 """
+from dataclasses import FrozenInstanceError
+
 import pytest
 from pydantic import ValidationError
 
 from src.modules.text_processor.models.domain import (
+    MAX_HISTORY,
     Message,
     ProcessingResult,
     SessionState,
@@ -29,6 +32,22 @@ class TestMessage:
         with pytest.raises(ValidationError):
             Message(content="Test message")  # Missing role
 
+    def test_message_is_immutable_and_slotted(self):
+        """Test that messages can be shared safely and carry no __dict__."""
+        message = Message(role="user", content="Test message")
+
+        with pytest.raises(FrozenInstanceError):
+            message.content = "Changed"
+        assert not hasattr(message, "__dict__")
+        assert message == Message(role="user", content="Test message")
+
+    def test_api_message_is_built_once(self):
+        """Test that the API form of a message is reused across accesses."""
+        message = Message(role="user", content="Test message")
+
+        assert message.api_message == {"role": "user", "content": "Test message"}
+        assert message.api_message is message.api_message
+
 
 class TestSessionState:
     """Tests for the SessionState class."""
@@ -38,24 +57,51 @@ class TestSessionState:
         state = SessionState()
 
         assert state.last_response == ""
-        assert isinstance(state.history, list)
+        assert state.system_message is None
         assert len(state.history) == 0
+        assert not hasattr(state, "__dict__")
 
     def test_custom_initialization(self):
         """Test initializing with custom values."""
         history = [
-            Message(role="system", content="System message"),
             Message(role="user", content="User message"),
             Message(role="assistant", content="Assistant response"),
         ]
 
-        state = SessionState(last_response="Test response", history=history)
+        state = SessionState(
+            last_response="Test response",
+            system_message=Message(role="system", content="System message"),
+            history=history,
+        )
 
         assert state.last_response == "Test response"
-        assert len(state.history) == 3
-        assert state.history[0].role == "system"
-        assert state.history[1].role == "user"
-        assert state.history[2].role == "assistant"
+        assert state.system_message.role == "system"
+        assert len(state.history) == 2
+        assert state.history[0].role == "user"
+        assert state.history[1].role == "assistant"
+
+    def test_history_is_bounded_on_initialization(self):
+        """Test that only the last MAX_HISTORY messages are kept."""
+        history = [
+            Message(role="user", content=f"Message {i}") for i in range(MAX_HISTORY + 2)
+        ]
+
+        state = SessionState(history=history)
+
+        assert len(state.history) == MAX_HISTORY
+        assert state.history[0].content == "Message 2"
+
+    def test_add_message_keeps_system_message_and_recent_turns(self):
+        """Test that history is trimmed to the last turns."""
+        state = SessionState(system_message=Message(role="system", content="System"))
+
+        for i in range(MAX_HISTORY + 3):
+            state.add_message(Message(role="user", content=f"Message {i}"))
+
+        assert len(state.history) == MAX_HISTORY
+        assert state.system_message.content == "System"
+        assert state.history[0].content == "Message 3"
+        assert state.history[-1].content == f"Message {MAX_HISTORY + 2}"
 
 
 class TestProcessingResult:
@@ -1,6 +1,8 @@
 """
 Tests for the in-memory repositories for the Text Processor.
 """
+from unittest.mock import patch
+
 import pytest
 
 from src.modules.text_processor.models.domain import Message, SessionState
@@ -20,8 +22,8 @@ def sample_session_state():
     """Fixture providing a sample session state."""
     return SessionState(
         last_response="Test response",
+        system_message=Message(role="system", content="System message"),
         history=[
-            Message(role="system", content="System message"),
             Message(role="user", content="User message"),
             Message(role="assistant", content="Assistant response"),
         ],
@@ -56,7 +58,7 @@ class TestInMemorySessionRepository:
 
         assert state == sample_session_state
         assert state.last_response == "Test response"
-        assert len(state.history) == 3
+        assert len(state.history) == 2
 
     def test_save_session_new(self, session_repository, sample_session_state):
         """Test saving a new session."""
@@ -75,8 +77,8 @@ class TestInMemorySessionRepository:
         # Create an updated state
         updated_state = SessionState(
             last_response="Updated response",
+            system_message=Message(role="system", content="System message"),
             history=[
-                Message(role="system", content="System message"),
                 Message(role="user", content="User message"),
                 Message(role="assistant", content="Assistant response"),
                 Message(role="user", content="Follow-up question"),
@@ -91,7 +93,7 @@ class TestInMemorySessionRepository:
         state = session_repository.get_session(session_id)
         assert state == updated_state
         assert state.last_response == "Updated response"
-        assert len(state.history) == 5
+        assert len(state.history) == 4
 
     def test_delete_session_existing(self, session_repository, sample_session_state):
         """Test deleting an existing session."""
@@ -110,3 +112,38 @@ class TestInMemorySessionRepository:
         result = session_repository.delete_session(session_id)
 
         assert result is False
+
+    def test_least_recently_used_session_is_evicted(self, sample_session_state):
+        """Test that the repository is bounded by max_sessions."""
+        session_repository = InMemorySessionRepository(max_sessions=2)
+        session_repository.save_session("a", sample_session_state)
+        session_repository.get_session("b")
+        session_repository.get_session("a")
+        session_repository.get_session("c")
+
+        assert list(session_repository._storage) == ["a", "c"]
+
+    def test_frequently_used_session_outlives_newer_one(self):
+        """Test that eviction prefers rarely used sessions over recent ones."""
+        session_repository = InMemorySessionRepository(max_sessions=2)
+        for _ in range(3):
+            session_repository.get_session("a")
+        session_repository.get_session("b")
+        session_repository.get_session("c")
+
+        assert list(session_repository._storage) == ["a", "c"]
+
+    def test_idle_session_expires(self, sample_session_state):
+        """Test that sessions untouched for longer than the TTL are dropped."""
+        session_repository = InMemorySessionRepository(ttl_seconds=10)
+        clock = "src.modules.text_processor.repositories.memory_repositories.time"
+        with patch(f"{clock}.monotonic", return_value=0.0):
+            session_repository.save_session("a", sample_session_state)
+            session_repository.save_session("b", sample_session_state)
+        with patch(f"{clock}.monotonic", return_value=5.0):
+            session_repository.get_session("b")
+        with patch(f"{clock}.monotonic", return_value=11.0):
+            state = session_repository.get_session("b")
+
+        assert state is sample_session_state
+        assert list(session_repository._storage) == ["b"]
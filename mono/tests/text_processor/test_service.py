@@ -1,7 +1,10 @@
 """
 Tests for the TextProcessorService.
 """
-from unittest.mock import MagicMock, patch
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -80,6 +83,60 @@ class TestTextProcessorService:
         assert result.response == "Mock AI response"
         mock_ai_client.generate_response.assert_called_once()
 
+    def test_process_text_transforms_in_one_call(
+        self, text_processor_service, mock_session_repository, mock_ai_client
+    ):
+        """Test that a transformation is analyzed and applied in one LLM call."""
+        state = SessionState(
+            system_message=Message(role="system", content="System message"),
+            history=[
+                Message(role="user", content="a blue car"),
+                Message(role="assistant", content="a blue car"),
+            ],
+        )
+        mock_session_repository.get_session.return_value = state
+        mock_ai_client.generate_response.return_value = (
+            "Category: COLOR_CHANGE\n"
+            "Intent: Change the color from blue to red\n"
+            "Specifics: Replace 'blue' with 'red'\n"
+            "Transformed: a red car"
+        )
+
+        result = text_processor_service.process_text("make it red", "session-id")
+
+        assert result.response == "a red car"
+        mock_ai_client.generate_response.assert_called_once()
+        mock_session_repository.get_session.assert_called_once_with("session-id")
+        assert [(m.role, m.content) for m in list(state.history)[-2:]] == [
+            ("user", "make it red"),
+            ("assistant", "a red car"),
+        ]
+
+    def test_transform_falls_back_to_two_steps(
+        self, text_processor_service, mock_ai_client
+    ):
+        """Test that an unparseable reply falls back to the two-step process."""
+        response = text_processor_service._transform("make it red", "a blue car")
+
+        assert response == "Mock AI response"
+        assert mock_ai_client.generate_response.call_count == 3
+
+    def test_get_current_text_state_skips_requests_for_input(
+        self, text_processor_service
+    ):
+        """Test that replies asking for input are not treated as text state."""
+        state = SessionState(
+            system_message=Message(role="system", content="System message"),
+            history=[
+                Message(role="user", content="a blue car"),
+                Message(role="assistant", content="a blue car"),
+                Message(role="user", content="make it red"),
+                Message(role="assistant", content="Please PROVIDE SOME TEXT first."),
+            ],
+        )
+
+        assert text_processor_service._get_current_text_state(state) == "a blue car"
+
     def test_generate_llm_response_valid_text(
         self, text_processor_service, mock_ai_client
     ):
@@ -96,6 +153,16 @@ class TestTextProcessorService:
         assert response == "Mock AI response"
         mock_ai_client.generate_response.assert_called_once()
 
+    def test_generate_llm_response_reuses_identical_requests(
+        self, text_processor_service, mock_ai_client
+    ):
+        """Test that an identical request is answered from the response cache."""
+        first = text_processor_service._generate_llm_response("a bright blue cow")
+        second = text_processor_service._generate_llm_response("a bright blue cow")
+
+        assert first == second == "Mock AI response"
+        mock_ai_client.generate_response.assert_called_once()
+
     def test_generate_llm_response_with_session(
         self, text_processor_service, mock_session_repository
     ):
@@ -103,8 +170,8 @@ class TestTextProcessorService:
         session_id = "test-session-id"
         state = SessionState(
             last_response="a bright blue cow",
+            system_message=Message(role="system", content="System message"),
             history=[
-                Message(role="system", content="System message"),
                 Message(role="user", content="a bright blue cow"),
                 Message(role="assistant", content="a bright blue cow"),
             ],
@@ -114,9 +181,26 @@ class TestTextProcessorService:
         text_processor_service._generate_llm_response("make it red", session_id)
 
         # Verify session repository was called correctly
-        mock_session_repository.get_session.assert_called_with(session_id)
+        mock_session_repository.get_session.assert_called_once_with(session_id)
         mock_session_repository.save_session.assert_called_once()
 
+    def test_generate_llm_response_sends_system_message_once(
+        self, text_processor_service, mock_session_repository, mock_ai_client
+    ):
+        """Test that the stored system message is not sent a second time."""
+        mock_session_repository.get_session.return_value = SessionState(
+            system_message=Message(role="system", content="System message"),
+            history=[
+                Message(role="user", content="make it purple"),
+                Message(role="assistant", content="Please provide some text"),
+            ],
+        )
+
+        text_processor_service._generate_llm_response("a blue car", "session-id")
+
+        messages = mock_ai_client.generate_response.call_args.kwargs["messages"]
+        assert [m["role"] for m in messages] == ["system", "user", "assistant", "user"]
+
     def test_generate_llm_response_exception_handling(
         self, text_processor_service, mock_ai_client
     ):
@@ -126,3 +210,82 @@ class TestTextProcessorService:
         response = text_processor_service._generate_llm_response("some text")
 
         assert "I encountered an AI processing issue: Test AI error" in response
+
+    def test_generate_llm_response_saves_in_background(
+        self, mock_session_repository, mock_ai_client
+    ):
+        """Test that sessions are saved on the save executor when one is given."""
+        executor = ThreadPoolExecutor(max_workers=1)
+        saved_on = []
+        mock_session_repository.save_session.side_effect = lambda *_: (
+            saved_on.append(threading.current_thread())
+        )
+        service = TextProcessorService(
+            session_repository=mock_session_repository,
+            ai_client=mock_ai_client,
+            save_executor=executor,
+        )
+
+        response = service._generate_llm_response("a blue car", "session-id")
+        executor.shutdown(wait=True)
+
+        assert response == "Mock AI response"
+        mock_session_repository.save_session.assert_called_once()
+        assert mock_session_repository.save_session.call_args.args[0] == "session-id"
+        assert saved_on != [threading.current_thread()]
+
+    def test_aprocess_text_establishes_with_async_client(
+        self, text_processor_service, mock_session_repository, mock_ai_client
+    ):
+        """Test that establishing text awaits the async AI client."""
+        state = SessionState()
+        mock_session_repository.get_session.return_value = state
+        mock_ai_client.agenerate_response = AsyncMock(return_value="a blue car")
+
+        result = asyncio.run(
+            text_processor_service.aprocess_text("a blue car", "session-id")
+        )
+
+        assert result.response == "a blue car"
+        mock_ai_client.agenerate_response.assert_awaited_once()
+        mock_ai_client.generate_response.assert_not_called()
+        assert state.last_response == "a blue car"
+        mock_session_repository.save_session.assert_called_once_with(
+            "session-id", state
+        )
+
+    def test_aprocess_text_transforms_existing_text(
+        self, text_processor_service, mock_session_repository, mock_ai_client
+    ):
+        """Test that transformations run through the sync transform path."""
+        mock_session_repository.get_session.return_value = SessionState(
+            system_message=Message(role="system", content="System message"),
+            history=[
+                Message(role="user", content="a blue car"),
+                Message(role="assistant", content="a blue car"),
+            ],
+        )
+        mock_ai_client.generate_response.return_value = "Transformed: a red car"
+
+        result = asyncio.run(
+            text_processor_service.aprocess_text("make it red", "session-id")
+        )
+
+        assert result.response == "a red car"
+        mock_session_repository.get_session.assert_called_once_with("session-id")
+
+    def test_process_text_survives_failing_repository(
+        self, text_processor_service, mock_session_repository
+    ):
+        """Test that a repository error produces a reply instead of raising."""
+        mock_session_repository.get_session.side_effect = RuntimeError("db down")
+
+        result = text_processor_service.process_text("a blue car", "session-id")
+        async_result = asyncio.run(
+            text_processor_service.aprocess_text("a blue car", "session-id")
+        )
+
+        for reply in (result, async_result):
+            assert isinstance(reply, ProcessingResult)
+            assert reply.session_id == "session-id"
+            assert "db down" in reply.response